@@ -0,0 +1,147 @@
+"""
+Debug counter for per-frame allocations.
+
+Enabled with WIZARD_ALLOC_DEBUG=1. install() swaps pygame.Surface and
+pygame.font.Font for subclasses that count every new surface and font:
+Surface(...), copy(), convert()/convert_alpha(), font render() and the
+image.load/transform functions the wizard uses. Surfaces pygame makes in C
+are re-wrapped as counted ones, so copies and conversions made from them
+later count too, and isinstance() against pygame.Surface still matches
+every surface. Frames that build a screen or open a modal call expect();
+any other frame that still allocates a Surface or Font is logged, since
+those should all come from load-time resources or the scratch pool.
+"""
+import os
+
+import pygame
+import pygame.sysfont
+
+from .constants import ALLOC_DEBUG_ENV
+from .utils import log
+
+enabled = bool(os.environ.get(ALLOC_DEBUG_ENV))
+
+MAX_REPORTS = 20
+
+counts = {"Surface": 0, "Font": 0}
+steady_allocs = {}  # screen name -> allocations made in steady-state frames
+_expected = True
+_reported = 0
+
+# pygame's own classes, from before install()
+original_surface = pygame.Surface
+original_font = pygame.font.Font
+_original_scale = pygame.transform.scale
+
+# Functions returning a new surface made in C
+WRAPPED_FUNCTIONS = [
+    (pygame.image, "load"),
+    (pygame.transform, "scale"),
+    (pygame.transform, "smoothscale"),
+]
+
+
+class SurfaceType(type):
+    """Makes isinstance(x, pygame.Surface) hold for uncounted surfaces too."""
+
+    def __instancecheck__(cls, obj):
+        return isinstance(obj, original_surface)
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, original_surface)
+
+
+class CountedSurface(original_surface, metaclass=SurfaceType):
+    counted = True
+
+    def __init__(self, *args, **kwargs):
+        counts["Surface"] += 1
+        super().__init__(*args, **kwargs)
+
+    # pygame builds these results as type(self), so they stay counted
+    def copy(self):
+        counts["Surface"] += 1
+        return super().copy()
+
+    def convert(self, *args):
+        counts["Surface"] += 1
+        return super().convert(*args)
+
+    def convert_alpha(self, *args):
+        counts["Surface"] += 1
+        return super().convert_alpha(*args)
+
+
+def adopt(surface):
+    """A counted stand-in for a surface pygame created in C (counts once)."""
+    if type(surface) is not original_surface:
+        counts["Surface"] += 1
+        return surface
+    size = surface.get_size()
+    counted = CountedSurface(size, surface.get_flags(), surface)
+    if surface.get_bitsize() == 8:
+        counted.set_palette(surface.get_palette())
+    # A same-size scale into a given surface copies the pixels as they are
+    _original_scale(surface, size, counted)
+    counted.set_colorkey(surface.get_colorkey())
+    counted.set_alpha(surface.get_alpha())
+    return counted
+
+
+class CountedFont(original_font):
+    def __init__(self, *args, **kwargs):
+        counts["Font"] += 1
+        super().__init__(*args, **kwargs)
+
+    def render(self, *args, **kwargs):
+        return adopt(super().render(*args, **kwargs))
+
+
+def counting(function):
+    def wrapper(*args, **kwargs):
+        return adopt(function(*args, **kwargs))
+    return wrapper
+
+
+def install():
+    if not enabled or getattr(pygame.Surface, "counted", False):
+        return
+    pygame.Surface = CountedSurface
+    pygame.font.Font = CountedFont
+    # SysFont builds its fonts through its own import of Font
+    pygame.sysfont.Font = CountedFont
+    for module, name in WRAPPED_FUNCTIONS:
+        setattr(module, name, counting(getattr(module, name)))
+    log("Allocation counter installed")
+
+
+def expect():
+    """This frame is allowed to allocate (a screen is being built, ...)."""
+    global _expected
+    _expected = True
+
+
+def frame_done(screen_name):
+    global _expected, _reported
+    if not enabled:
+        return
+    made = {kind: n for kind, n in counts.items() if n}
+    for kind in counts:
+        counts[kind] = 0
+    if made and not _expected:
+        steady_allocs[screen_name] = steady_allocs.get(screen_name, 0) + sum(made.values())
+        if _reported < MAX_REPORTS:
+            _reported += 1
+            detail = ", ".join(f"{kind} x{n}" for kind, n in made.items())
+            log(f"Allocations in a steady frame on {screen_name}: {detail}")
+    _expected = False
+
+
+def log_summary():
+    if not enabled:
+        return
+    if not steady_allocs:
+        log("Allocation counter: no steady-state frame allocated a Surface or Font")
+        return
+    for name, n in sorted(steady_allocs.items()):
+        log(f"Allocation counter: {name}: {n} allocations in steady-state frames")
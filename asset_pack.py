@@ -0,0 +1,250 @@
+"""
+Baked asset pack: every image the screens declare, already converted and
+scaled to its final size, stored as raw BGRA pixels in one file that is
+memory-mapped at startup.
+
+Build it (on the cabinet or any machine with pygame) with:
+
+    python -m arcade_wizard.asset_pack [--allow-missing]
+
+This also writes a manifest listing every declared image, sound and font,
+and exits non-zero if any of them are missing.
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import argparse
+import datetime
+
+import pygame
+
+from .constants import ASSET_PACK_FILE, ASSET_MANIFEST_FILE
+from .utils import log
+
+PACK_MAGIC = b"AWPACK1\n"
+PIXEL_FORMAT = "BGRA"  # ARGB8888 on little-endian, the Pi's 32-bit framebuffer layout
+ALIGN = 16
+
+
+class AssetPack:
+    """
+    Read side of the pack. surface() builds a Surface straight on top of the
+    mapped pixels; only opaque images (or a display with a different pixel
+    layout) are copied by convert()/convert_alpha().
+    """
+
+    def __init__(self, path, base_dir):
+        self.path = path
+        self.file = open(path, "rb")
+        # ACCESS_COPY so nothing drawing onto a shared surface can fault
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if self.map[:len(PACK_MAGIC)] != PACK_MAGIC:
+            raise ValueError(f"{path} is not an asset pack")
+        header_at = len(PACK_MAGIC)
+        (index_len,) = struct.unpack_from("<I", self.map, header_at)
+        index_at = header_at + 4
+        index = json.loads(self.map[index_at:index_at + index_len].decode("utf-8"))
+        # Pixel data starts at the next aligned offset after the index
+        header_len = index_at + index_len
+        self.data_start = header_len + (-header_len % ALIGN)
+
+        self.entries = {}
+        for entry in index["images"]:
+            full_path = os.path.join(base_dir, entry["path"])
+            size = tuple(entry["size"]) if entry["size"] else None
+            self.entries[(full_path, size, entry["alpha"])] = entry
+
+    @classmethod
+    def open(cls, path, base_dir):
+        """The pack at path, or None (logged) if it's absent or unreadable."""
+        if not os.path.exists(path):
+            log(f"No asset pack at {path}; decoding images individually.")
+            return None
+        try:
+            pack = cls(path, base_dir)
+            log(f"Asset pack loaded: {len(pack.entries)} images from {path}")
+            return pack
+        except Exception as e:
+            log(f"Failed to open asset pack {path}: {e}")
+            return None
+
+    def has(self, path, size, alpha):
+        return (path, size, alpha) in self.entries
+
+    def surface(self, path, size, alpha):
+        entry = self.entries.get((path, size, alpha))
+        if entry is None:
+            return None
+        # A source image that changed since the pack was baked wins over the pack
+        try:
+            st = os.stat(path)
+            # Size alone misses an edit that keeps the byte count
+            if st.st_size != entry["source_bytes"] or st.st_mtime_ns != entry.get("source_mtime_ns"):
+                log(f"Asset pack entry for {path} is stale; decoding the image instead.")
+                return None
+        except OSError:
+            pass
+
+        start = self.data_start + entry["offset"]
+        view = memoryview(self.map)[start:start + entry["length"]]
+        img = pygame.image.frombuffer(view, tuple(entry["pixels"]), PIXEL_FORMAT)
+        if not alpha:
+            return img.convert()
+        display = pygame.display.get_surface()
+        if display and display.get_bitsize() == 32 and display.get_masks()[:3] == img.get_masks()[:3]:
+            return img
+        return img.convert_alpha()
+
+
+###############################################################################
+# BUILD STEP
+###############################################################################
+def declared_assets():
+    """
+    Every image/sound/font that Application and the Screen subclasses
+    declare via their IMAGES / SOUNDS / FONTS class attributes.
+    Images come back as (filename, size, alpha).
+    """
+    from .main import Application
+    from .screen_manager import Screen
+    from .assets import declared_images
+
+    owners = [Application] + Screen.__subclasses__()
+    images, sounds, fonts = [], [], []
+    for owner in owners:
+        for item in declared_images(owner):
+            if item not in images:
+                images.append(item)
+        for filename in getattr(owner, "SOUNDS", []):
+            if filename not in sounds:
+                sounds.append(filename)
+        for filename in getattr(owner, "FONTS", []):
+            if filename not in fonts:
+                fonts.append(filename)
+    return images, sounds, fonts
+
+
+def file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def build_pack(base_dir, pack_path, manifest_path, allow_missing=False):
+    """
+    Bake the pack and write the manifest. Returns the list of missing files;
+    unless allow_missing, the pack itself is only written if that is empty.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    # convert()/convert_alpha() need a display; the format is fixed by tobytes below
+    pygame.display.set_mode((1, 1))
+
+    images, sounds, fonts = declared_assets()
+    manifest = {
+        "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+        "pack": os.path.basename(pack_path),
+        "pixel_format": PIXEL_FORMAT,
+        "images": [],
+        "sounds": [],
+        "fonts": [],
+        "missing": [],
+    }
+
+    index = []
+    blobs = []
+    data_size = 0
+    for filename, size, alpha in images:
+        rel = os.path.join("images", filename)
+        src = os.path.join(base_dir, rel)
+        record = {"path": rel, "size": size, "alpha": alpha}
+        if not os.path.exists(src):
+            record["status"] = "missing"
+            manifest["missing"].append(rel)
+            manifest["images"].append(record)
+            continue
+
+        img = pygame.image.load(src)
+        img = img.convert_alpha() if alpha else img.convert()
+        if size and img.get_size() != size:
+            img = pygame.transform.scale(img, size)
+        raw = pygame.image.tobytes(img, PIXEL_FORMAT)
+
+        index.append({
+            "path": rel,
+            "size": size,
+            "alpha": alpha,
+            "pixels": img.get_size(),
+            "offset": data_size,
+            "length": len(raw),
+            "source_bytes": os.path.getsize(src),
+            "source_mtime_ns": os.stat(src).st_mtime_ns,
+        })
+        blobs.append(raw)
+        data_size += len(raw) + (-len(raw) % ALIGN)
+
+        record.update(status="ok", pixels=img.get_size(), bytes=len(raw), sha1=file_sha1(src))
+        manifest["images"].append(record)
+
+    for kind, subdir, names in (("sounds", "sounds", sounds), ("fonts", "fonts", fonts)):
+        for filename in names:
+            rel = os.path.join(subdir, filename)
+            src = os.path.join(base_dir, rel)
+            if os.path.exists(src):
+                manifest[kind].append({"path": rel, "status": "ok", "sha1": file_sha1(src)})
+            else:
+                manifest[kind].append({"path": rel, "status": "missing"})
+                manifest["missing"].append(rel)
+
+    if manifest["missing"] and not allow_missing:
+        log(f"Asset pack not written, missing: {', '.join(manifest['missing'])}")
+    else:
+        index_json = json.dumps({"images": index}).encode("utf-8")
+        header_len = len(PACK_MAGIC) + 4 + len(index_json)
+        tmp_path = pack_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(PACK_MAGIC)
+            f.write(struct.pack("<I", len(index_json)))
+            f.write(index_json)
+            f.write(b"\0" * (-header_len % ALIGN))
+            for raw in blobs:
+                f.write(raw)
+                f.write(b"\0" * (-len(raw) % ALIGN))
+        os.replace(tmp_path, pack_path)
+        log(f"Asset pack written: {len(index)} images, {data_size // 1024} KiB")
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    pygame.display.quit()
+    return manifest["missing"]
+
+
+def main(argv=None):
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Bake the setup wizard's images into an asset pack.")
+    parser.add_argument("--output", default=os.path.join(base_dir, ASSET_PACK_FILE))
+    parser.add_argument("--manifest", default=os.path.join(base_dir, ASSET_MANIFEST_FILE))
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="write the pack even if some declared assets are missing")
+    args = parser.parse_args(argv)
+
+    missing = build_pack(base_dir, args.output, args.manifest, args.allow_missing)
+    print(f"Wrote {args.manifest}")
+    if missing:
+        print("Missing assets:")
+        for rel in missing:
+            print(f"  {rel}")
+        if not args.allow_missing:
+            print("Asset pack not written (use --allow-missing to write it anyway).")
+            return 1
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
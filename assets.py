@@ -0,0 +1,232 @@
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from .constants import ASSET_CACHE_BYTES, ASSET_PRELOAD_WORKERS
+from .utils import log
+
+
+class AssetManager:
+    """
+    Shared cache for images, sounds and fonts, hung off Application as
+    app.assets so every screen gets the same decoded/scaled copy.
+
+    Images are keyed by (path, size, alpha), sounds by path and fonts by
+    (path, size). Every load takes a reference; release() drops it. Entries
+    nobody references stay cached but are evicted least-recently-used first
+    once the cache is over ASSET_CACHE_BYTES.
+
+    With an AssetPack, images it contains are built from the mapped pack
+    instead of being decoded and scaled.
+    """
+
+    def __init__(self, budget_bytes=ASSET_CACHE_BYTES, pack=None):
+        self.budget_bytes = budget_bytes
+        self.pack = pack
+        self.pack_loads = 0
+        self.entries = OrderedDict()  # key -> [asset, refs, nbytes]
+        self.keys_by_id = {}
+        self.total_bytes = 0
+        self.hits = {"image": 0, "sound": 0, "font": 0}
+        self.misses = {"image": 0, "sound": 0, "font": 0}
+        self.evictions = 0
+        self.preloaded = 0
+        # path -> (decode ms on a worker, convert ms on the main thread)
+        self.load_times = {}
+        # (size, alpha) -> reusable work surface, see scratch()
+        self.scratch_surfaces = {}
+
+    def image(self, path, size=None, alpha=True):
+        """Load, convert and (optionally) scale an image. Raises on failure."""
+        size = tuple(size) if size else None
+        return self.acquire(("image", path, size, alpha), lambda: self.load_image(path, size, alpha))
+
+    def sound(self, path, volume=None):
+        snd = self.acquire(("sound", path), lambda: pygame.mixer.Sound(path))
+        if volume is not None:
+            snd.set_volume(volume)
+        return snd
+
+    def font(self, path, size):
+        return self.acquire(("font", path, size), lambda: pygame.font.Font(path, size))
+
+    def scratch(self, size, alpha=False):
+        """
+        A display-format work surface of this size, allocated once and handed
+        out again on every later call. Its contents belong to whoever asked
+        for it last, so don't hold on to one across frames you don't own.
+        """
+        key = (tuple(size), alpha)
+        surf = self.scratch_surfaces.get(key)
+        if surf is None:
+            if alpha:
+                surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            else:
+                surf = pygame.Surface(size).convert()
+            self.scratch_surfaces[key] = surf
+        return surf
+
+    def load_image(self, path, size, alpha):
+        if self.pack:
+            img = self.pack.surface(path, size, alpha)
+            if img is not None:
+                self.pack_loads += 1
+                return img
+        img = pygame.image.load(path)
+        img = img.convert_alpha() if alpha else img.convert()
+        if size and img.get_size() != size:
+            img = pygame.transform.scale(img, size)
+        return img
+
+    def acquire(self, key, loader):
+        kind = key[0]
+        entry = self.entries.get(key)
+        if entry:
+            self.hits[kind] += 1
+            entry[1] += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+        self.misses[kind] += 1
+        asset = loader()
+        self.store(key, asset, 1)
+        return asset
+
+    def store(self, key, asset, refs):
+        nbytes = asset_size(asset)
+        self.entries[key] = [asset, refs, nbytes]
+        self.keys_by_id[id(asset)] = key
+        self.total_bytes += nbytes
+        self.evict()
+
+    def preload(self, items):
+        """
+        items: (path, size, alpha) tuples. PNG decode and scaling run on a
+        small thread pool (both release the GIL); only convert()/
+        convert_alpha() run here on the main thread, since they need the
+        display. Results wait in the cache, unreferenced, until a screen
+        asks for them. Anything already cached or in the pack is skipped.
+        """
+        todo = []
+        for path, size, alpha in items:
+            size = tuple(size) if size else None
+            key = ("image", path, size, alpha)
+            if key in self.entries or key in todo:
+                continue
+            if self.pack and self.pack.has(path, size, alpha):
+                continue
+            todo.append(key)
+        if not todo:
+            return
+
+        start = time.perf_counter()
+        decode_total = 0.0
+        done = 0
+        with ThreadPoolExecutor(max_workers=ASSET_PRELOAD_WORKERS) as pool:
+            jobs = [(key, pool.submit(decode_image, key[1], key[2])) for key in todo]
+            for key, job in jobs:
+                _, path, size, alpha = key
+                try:
+                    img, decode_ms = job.result()
+                except Exception as e:
+                    log(f"Preload of {path} failed: {e}")
+                    continue
+                t = time.perf_counter()
+                img = img.convert_alpha() if alpha else img.convert()
+                convert_ms = (time.perf_counter() - t) * 1000
+                self.store(key, img, 0)
+                self.load_times[path] = (decode_ms, convert_ms)
+                decode_total += decode_ms
+                done += 1
+                log(f"Preloaded {os.path.basename(path)}: decode {decode_ms:.1f} ms, "
+                    f"convert {convert_ms:.1f} ms")
+
+        self.preloaded += done
+        total_ms = (time.perf_counter() - start) * 1000
+        log(f"Preloaded {done}/{len(todo)} images in {total_ms:.0f} ms on "
+            f"{ASSET_PRELOAD_WORKERS} threads ({os.cpu_count()} cores), "
+            f"{decode_total:.0f} ms of decode work")
+
+    def key_for(self, asset):
+        """The cache key an asset was loaded under, e.g. ("font", path, size)."""
+        return self.keys_by_id.get(id(asset))
+
+    def release(self, asset):
+        key = self.keys_by_id.get(id(asset))
+        if key is None:
+            return
+        entry = self.entries[key]
+        entry[1] = max(0, entry[1] - 1)
+        self.evict()
+
+    def evict(self):
+        if self.total_bytes <= self.budget_bytes:
+            return
+        for key in list(self.entries):
+            asset, refs, nbytes = self.entries[key]
+            if refs:
+                continue
+            del self.entries[key]
+            del self.keys_by_id[id(asset)]
+            self.total_bytes -= nbytes
+            self.evictions += 1
+            if self.total_bytes <= self.budget_bytes:
+                break
+
+    def stats(self):
+        return {
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "evictions": self.evictions,
+            "pack_loads": self.pack_loads,
+            "preloaded": self.preloaded,
+        }
+
+    def describe(self):
+        hits = sum(self.hits.values())
+        misses = sum(self.misses.values())
+        return (f"{len(self.entries)} cached, {self.total_bytes // 1024} KiB, "
+                f"{hits} hits / {misses} misses ({self.pack_loads} from pack), "
+                f"{self.evictions} evicted")
+
+    def log_stats(self):
+        log(f"Assets: {self.describe()}")
+
+
+def decode_image(path, size):
+    """Worker-thread half of a load: decode and scale, no display needed."""
+    start = time.perf_counter()
+    img = pygame.image.load(path)
+    if size and img.get_size() != size:
+        img = pygame.transform.scale(img, size)
+    return img, (time.perf_counter() - start) * 1000
+
+
+def declared_images(owner):
+    """
+    An owner's IMAGES (Application or a Screen subclass) normalised to
+    (filename, size, alpha); entries may leave alpha out, defaulting to True.
+    """
+    result = []
+    for entry in getattr(owner, "IMAGES", []):
+        size = tuple(entry[1]) if entry[1] else None
+        alpha = entry[2] if len(entry) > 2 else True
+        result.append((entry[0], size, alpha))
+    return result
+
+
+def asset_size(asset):
+    if isinstance(asset, pygame.Surface):
+        return asset.get_width() * asset.get_height() * asset.get_bytesize()
+    if isinstance(asset, pygame.mixer.Sound):
+        init = pygame.mixer.get_init()
+        if init:
+            freq, fmt, channels = init
+            return int(asset.get_length() * freq * channels * (abs(fmt) // 8))
+    # Fonts are small and never worth evicting
+    return 0
@@ -0,0 +1,76 @@
+"""
+Boot timeline from process start to the first presented frame.
+
+Enabled with WIZARD_BOOT_PROFILE=1 (the launcher's --boot-profile sets it). Each mark() records
+the end of a startup phase; finish() logs the timeline and writes it as JSON
+to BOOT_PROFILE_FILE. When disabled, mark() and finish() return straight
+away. This module must not import pygame, since it times that import.
+"""
+import os
+import json
+import time
+
+from .constants import BOOT_PROFILE_ENV, BOOT_PROFILE_FILE
+
+enabled = bool(os.environ.get(BOOT_PROFILE_ENV))
+
+_marks = []
+_finished = False
+
+
+def mark(phase):
+    if enabled:
+        _marks.append((phase, time.perf_counter()))
+
+
+def process_age():
+    """Seconds since this process started, from /proc; None elsewhere."""
+    try:
+        with open("/proc/self/stat") as f:
+            # The command name may contain spaces; fields resume after ')'
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def finish(phase="first frame presented"):
+    global _finished
+    if not enabled or _finished:
+        return
+    _finished = True
+    mark(phase)
+
+    from .utils import log
+
+    now = time.perf_counter()
+    age = process_age()
+    # Time zero is process start when /proc tells us, else the first mark
+    origin = now - age if age is not None else _marks[0][1]
+
+    phases = []
+    prev = origin
+    for name, t in _marks:
+        phases.append({
+            "phase": name,
+            "end_ms": round((t - origin) * 1000, 1),
+            "duration_ms": round((t - prev) * 1000, 1),
+        })
+        prev = t
+    timeline = {
+        "origin": "process start" if age is not None else phases[0]["phase"],
+        "total_ms": phases[-1]["end_ms"],
+        "phases": phases,
+    }
+
+    log(f"Boot timeline ({timeline['total_ms']:.0f} ms to first frame, from {timeline['origin']}):")
+    for p in phases:
+        log(f"  {p['end_ms']:8.1f} ms  +{p['duration_ms']:7.1f} ms  {p['phase']}")
+    try:
+        with open(BOOT_PROFILE_FILE, "w") as f:
+            json.dump(timeline, f, indent=2)
+    except Exception as e:
+        log(f"Failed to write boot profile {BOOT_PROFILE_FILE}: {e}")
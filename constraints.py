@@ -10,6 +10,7 @@ FPS = 60
 LOG_DIR = "/home/pi/RetroPie/custom_scripts/logs"
 APP_LOG_FILE = os.path.join(LOG_DIR, "setup_gui.log")
 TERMS_LOG_FILE = os.path.join(LOG_DIR, "terms_agreement.log")
+CACHE_DIR = "/home/pi/RetroPie/custom_scripts/cache"
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -23,3 +24,96 @@ YELLOW = (255, 255, 0)
 SETUP_COMPLETE_FLAG = "/home/pi/RetroPie/custom_scripts/setup_wizard_completed"
 AUTOSTART_PATH = "/opt/retropie/configs/all/autostart.sh"
 AUTO_UPDATE_SCRIPT = "/home/pi/RetroPie/custom_scripts/update_system_auto.sh"
+
+# Frame scheduler: drop to IDLE_FPS after IDLE_AFTER_SECS without input or
+# screen changes, then block in pygame.event.wait after EVENT_WAIT_AFTER_SECS.
+IDLE_FPS = 10
+IDLE_AFTER_SECS = 5
+EVENT_WAIT_AFTER_SECS = 30
+EVENT_WAIT_TIMEOUT_MS = 250
+
+# Cap the frame rate while the SoC runs hot (millidegrees in sysfs)
+THERMAL_ZONE_GLOB = "/sys/class/thermal/thermal_zone*/temp"
+THERMAL_LIMIT_C = 75
+THERMAL_RELEASE_C = 70
+THERMAL_FPS = 30
+THERMAL_CHECK_SECS = 5
+
+# Unreferenced images/sounds are evicted (least recently used first) once
+# the asset cache grows past this many bytes.
+ASSET_CACHE_BYTES = 64 * 1024 * 1024
+
+# Pre-baked images (see asset_pack.py), relative to the wizard's folder
+ASSET_PACK_FILE = "assets.pack"
+ASSET_MANIFEST_FILE = "assets_manifest.json"
+
+# Threads used to decode/scale images in parallel before a screen is built
+ASSET_PRELOAD_WORKERS = min(4, os.cpu_count() or 1)
+
+# Boot timeline: set WIZARD_BOOT_PROFILE=1 (or launch with --boot-profile) to log
+# how long each startup phase takes and write it to BOOT_PROFILE_FILE.
+BOOT_PROFILE_ENV = "WIZARD_BOOT_PROFILE"
+BOOT_PROFILE_FILE = os.path.join(LOG_DIR, "boot_profile.json")
+
+# Frame-time HUD: WIZARD_FRAME_HUD=1 shows it from the start; F3 or holding
+# the HUD_COMBO_BUTTONS together (Select+Start on most pads) toggles it.
+FRAME_HUD_ENV = "WIZARD_FRAME_HUD"
+HUD_COMBO_BUTTONS = (6, 7)
+HUD_WINDOW = 300
+HUD_REFRESH_MS = 250
+
+# Rendered text surfaces kept by the shared text cache (see text_cache.py)
+TEXT_CACHE_ENTRIES = 512
+
+# Compose the pixel fonts from glyph atlases (glyph_atlas.py) instead of
+# font.render. Off: on the benchmark SDL_ttf's own glyph cache is faster.
+GLYPH_ATLAS_ENABLED = False
+
+# Allocation counter: WIZARD_ALLOC_DEBUG=1 counts new Surfaces and Fonts and
+# logs any made in a steady-state frame (not while a screen is being built).
+ALLOC_DEBUG_ENV = "WIZARD_ALLOC_DEBUG"
+
+# Input-to-photon latency: WIZARD_INPUT_LATENCY=1 times each press from the
+# frame that read it to the display update that shows its effect, per screen
+# and input device, and logs the distributions (see input_latency.py)
+INPUT_LATENCY_ENV = "WIZARD_INPUT_LATENCY"
+INPUT_LATENCY_WINDOW = 1000
+
+# Audio output; WIZARD_MIXER_BUFFER overrides the buffer size (samples) to
+# compare its effect on latency
+MIXER_FREQUENCY = 48000
+MIXER_BUFFER = 4096
+MIXER_BUFFER_ENV = "WIZARD_MIXER_BUFFER"
+
+# Height of the tiles long scrolling text (the terms) is rasterized into
+TEXT_TILE_HEIGHT = 256
+
+# Wrapped terms line table, reused across boots while the text, font and
+# box width stay the same
+TERMS_LAYOUT_CACHE_FILE = os.path.join(CACHE_DIR, "terms_layout.json")
+
+# Wi-Fi backend: nmcli, or WIZARD_NETWORK_BACKEND=fake[:count[:latency_secs]]
+# for a simulated one (see network_backend.py)
+NETWORK_BACKEND_ENV = "WIZARD_NETWORK_BACKEND"
+NMCLI_PATH = "/usr/bin/nmcli"
+SCAN_TIMEOUT_SECS = 20
+CONNECT_TIMEOUT_SECS = 30
+# Scans requested sooner than this after the previous one are queued, not run
+SCAN_MIN_INTERVAL_SECS = 10
+# How long a connect attempt waits for DHCP before reporting time-to-IP
+IP_WAIT_SECS = 20
+# Last scan results, shown (marked stale) on the next launch until its
+# first scan is in. Networks not seen for WIFI_SCAN_CACHE_TTL_SECS drop out.
+WIFI_SCAN_CACHE_FILE = os.path.join(CACHE_DIR, "wifi_scan.json")
+WIFI_SCAN_CACHE_TTL_SECS = 24 * 60 * 60
+
+# Worker -> UI messages whose post-to-dispatch latency is kept for the stats
+EVENT_BUS_LATENCY_WINDOW = 500
+
+# Stick directions press past INPUT_AXIS_PRESS and release below
+# INPUT_AXIS_RELEASE; held directions repeat after INPUT_REPEAT_DELAY_MS,
+# then every INPUT_REPEAT_INTERVAL_MS (see input_mapper.py)
+INPUT_AXIS_PRESS = 0.5
+INPUT_AXIS_RELEASE = 0.3
+INPUT_REPEAT_DELAY_MS = 400
+INPUT_REPEAT_INTERVAL_MS = 120
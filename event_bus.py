@@ -0,0 +1,99 @@
+"""
+Worker thread -> UI thread messages.
+
+Workers never touch screen state. They post(event_type, message) with a
+message that is an immutable snapshot (tuples, frozensets, strings, or
+objects the worker won't touch again). The message rides the SDL event
+queue as a pygame custom event, so a main loop asleep in
+pygame.event.wait() wakes up the moment a result is in. The main loop
+passes everything it reads through dispatch(), which calls the handlers
+subscribed to each bus event type on the UI thread and hands back the
+remaining (input) events.
+"""
+import time
+from collections import deque
+
+import pygame
+
+from .constants import EVENT_BUS_LATENCY_WINDOW
+from .utils import log
+from .frame_hud import percentile
+
+
+class EventBus:
+    def __init__(self):
+        self.names = {}     # event type -> name
+        self.handlers = {}  # event type -> [handler(message)]
+        self.posted = {}
+        self.delivered = {}
+        self.dropped = 0
+        self.started = time.monotonic()
+        # Post -> dispatch latency (ms) of the most recent messages
+        self.latencies = deque(maxlen=EVENT_BUS_LATENCY_WINDOW)
+        self.max_latency = 0.0
+
+    def register(self, name):
+        """A new pygame event type for messages called name."""
+        event_type = pygame.event.custom_type()
+        self.names[event_type] = name
+        self.handlers[event_type] = []
+        self.posted[event_type] = 0
+        self.delivered[event_type] = 0
+        return event_type
+
+    def subscribe(self, event_type, handler):
+        self.handlers[event_type].append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        try:
+            self.handlers[event_type].remove(handler)
+        except ValueError:
+            pass
+
+    def post(self, event_type, message):
+        """Queue message for the UI thread. Safe to call from any thread."""
+        event = pygame.event.Event(event_type, message=message, posted=time.perf_counter())
+        try:
+            ok = pygame.event.post(event)
+        except pygame.error as e:
+            ok = False
+            log(f"Event bus: could not post {self.names.get(event_type)}: {e}")
+        if ok is False:
+            # SDL's queue is full or the event type is blocked
+            self.dropped += 1
+        else:
+            self.posted[event_type] += 1
+
+    def dispatch(self, events):
+        """Run handlers for the bus events in events; return the others."""
+        others = []
+        for e in events:
+            handlers = self.handlers.get(e.type)
+            if handlers is None:
+                others.append(e)
+                continue
+            ms = (time.perf_counter() - e.posted) * 1000
+            self.latencies.append(ms)
+            self.max_latency = max(self.max_latency, ms)
+            self.delivered[e.type] += 1
+            for handler in list(handlers):
+                handler(e.message)
+        return others
+
+    def event_types(self):
+        return list(self.names)
+
+    def describe(self):
+        values = sorted(self.latencies)
+        counts = ", ".join(
+            f"{name} {self.delivered[t]}/{self.posted[t]}" for t, name in self.names.items()
+        )
+        rate = sum(self.delivered.values()) / max(time.monotonic() - self.started, 1e-6)
+        return (f"delivered/posted {counts}; dropped {self.dropped}; {rate:.2f} msg/s; latency p50/p95/max "
+                f"{percentile(values, 50):.1f}/{percentile(values, 95):.1f}/{self.max_latency:.1f} ms")
+
+    def log_stats(self):
+        log(f"Event bus: {self.describe()}")
+
+
+event_bus = EventBus()
@@ -0,0 +1,144 @@
+import os
+import time
+from collections import deque
+
+import pygame
+
+from .constants import FPS, FRAME_HUD_ENV, HUD_COMBO_BUTTONS, HUD_WINDOW, HUD_REFRESH_MS, WHITE, YELLOW
+from .utils import log
+
+PHASES = ("events", "update", "render", "flip")
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class ScreenFrameStats:
+    """Rolling per-phase frame times (ms) for one screen."""
+
+    def __init__(self):
+        self.samples = {phase: deque(maxlen=HUD_WINDOW) for phase in PHASES + ("total",)}
+        self.frames = 0
+        self.dropped = 0
+
+    def add(self, times):
+        total = sum(times)
+        for phase, ms in zip(PHASES, times):
+            self.samples[phase].append(ms)
+        self.samples["total"].append(total)
+        self.frames += 1
+        # A frame whose own work doesn't fit the FPS budget is a dropped frame;
+        # deliberate idle sleeps from the frame scheduler don't count.
+        if total > 1000.0 / FPS:
+            self.dropped += 1
+
+    def percentiles(self, phase):
+        values = sorted(self.samples[phase])
+        return percentile(values, 50), percentile(values, 95), percentile(values, 99)
+
+
+class FrameHud:
+    """
+    Debug overlay drawn by Application.run on top of the scene. Shows the
+    active screen's frame time split into event handling, update, render
+    and display update, with rolling p50/p95/p99 and dropped frames.
+    Stats are kept per screen and logged when the HUD is hidden or the
+    app exits.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.enabled = bool(os.environ.get(FRAME_HUD_ENV))
+        self.stats = {}
+        self.screen_name = None
+
+        self.line_height = font.get_linesize() + 2
+        self.rect = pygame.Rect(10, 10, 620, self.line_height * (len(PHASES) + 4) + 10)
+        self.panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.last_refresh = 0
+        self.erase_pending = False
+
+    def handle_events(self, events, joystick):
+        for e in events:
+            toggle = False
+            if e.type == pygame.KEYDOWN and e.key == pygame.K_F3:
+                toggle = True
+            elif e.type == pygame.JOYBUTTONDOWN and joystick:
+                if all(joystick.get_button(b) for b in HUD_COMBO_BUTTONS):
+                    toggle = True
+            if toggle:
+                self.enabled = not self.enabled
+                if not self.enabled:
+                    self.erase_pending = True
+                    self.log_summary()
+
+    def record(self, screen_name, events_ms, update_ms, render_ms, flip_ms):
+        if not self.enabled:
+            return
+        self.screen_name = screen_name
+        stats = self.stats.get(screen_name)
+        if stats is None:
+            stats = self.stats[screen_name] = ScreenFrameStats()
+        stats.add((events_ms, update_ms, render_ms, flip_ms))
+
+    def repaint_rect(self):
+        """
+        Area the scene should repaint under the HUD this frame. While the HUD
+        is shown that is always its whole rect: the panel is translucent, so
+        it may only be blitted over scene pixels repainted this frame, or the
+        dimming stacks up. After it was hidden, once more to erase it.
+        """
+        if self.erase_pending:
+            self.erase_pending = False
+            return self.rect
+        if self.enabled:
+            return self.rect
+        return None
+
+    def refresh_due(self):
+        return (time.monotonic() - self.last_refresh) * 1000 >= HUD_REFRESH_MS
+
+    def overlay(self, surface, dirty):
+        """Draw the HUD over the freshly rendered scene; returns the rects to present."""
+        if not self.enabled:
+            return dirty
+        if self.refresh_due():
+            self.redraw_panel()
+            self.last_refresh = time.monotonic()
+        # repaint_rect() had the scene repaint all of self.rect underneath
+        surface.blit(self.panel, self.rect)
+        return list(dirty) + [self.rect]
+
+    def redraw_panel(self):
+        self.panel.fill((0, 0, 0, 190))
+        stats = self.stats.get(self.screen_name)
+        # Each row is a list of cells drawn at fixed columns (the font isn't monospaced)
+        rows = [([f"screen: {self.screen_name}"], YELLOW)]
+        if stats:
+            pct = 100.0 * stats.dropped / stats.frames
+            rows.append(([f"frames {stats.frames}  dropped {stats.dropped} ({pct:.1f}%) @ {FPS} fps"], WHITE))
+            rows.append((["phase ms", "p50", "p95", "p99"], YELLOW))
+            for phase in PHASES + ("total",):
+                p50, p95, p99 = stats.percentiles(phase)
+                rows.append(([phase, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"], WHITE))
+        columns = (8, 170, 290, 410)
+        y = 5
+        for cells, color in rows:
+            for x, text in zip(columns, cells):
+                self.panel.blit(self.font.render(text, True, color), (x, y))
+            y += self.line_height
+
+    def log_summary(self):
+        for name, stats in self.stats.items():
+            if not stats.frames:
+                continue
+            parts = []
+            for phase in PHASES + ("total",):
+                p50, p95, p99 = stats.percentiles(phase)
+                parts.append(f"{phase} {p50:.1f}/{p95:.1f}/{p99:.1f}")
+            log(f"Frame times [{name}] p50/p95/p99 ms: {', '.join(parts)}; "
+                f"dropped {stats.dropped}/{stats.frames}")
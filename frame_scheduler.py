@@ -0,0 +1,141 @@
+import glob
+import time
+import pygame
+
+from .constants import (
+    FPS, IDLE_FPS, IDLE_AFTER_SECS, EVENT_WAIT_AFTER_SECS, EVENT_WAIT_TIMEOUT_MS,
+    THERMAL_ZONE_GLOB, THERMAL_LIMIT_C, THERMAL_RELEASE_C, THERMAL_FPS, THERMAL_CHECK_SECS
+)
+from .utils import log
+
+MODE_ACTIVE = "active"
+MODE_IDLE = "idle"
+MODE_WAIT = "wait"
+
+
+class FrameScheduler:
+    """
+    Replaces the fixed clock.tick(FPS) in Application.run.
+      - active: full FPS while there is input or something on screen changed
+      - idle:   IDLE_FPS once nothing happened for IDLE_AFTER_SECS
+      - wait:   block in pygame.event.wait() (bounded by EVENT_WAIT_TIMEOUT_MS)
+    Any input, presented frame or event bus message goes straight back to
+    active (bus messages are SDL events, so they also end the wait). Independently, the rate is capped at THERMAL_FPS while the hottest
+    thermal zone is above THERMAL_LIMIT_C.
+    """
+
+    def __init__(self):
+        self.clock = pygame.time.Clock()
+        self.mode = MODE_ACTIVE
+        self.last_activity = time.monotonic()
+
+        self.temperature = None
+        self.thermal_capped = False
+        self.last_thermal_check = 0
+
+        # Rolling one-second window for the reported rates
+        self.window_start = time.monotonic()
+        self.window_frames = 0
+        self.window_presented = 0
+        self.loop_fps = 0.0
+        self.presented_fps = 0.0
+
+    def get_events(self):
+        """
+        Drop-in for pygame.event.get(). In wait mode this sleeps until an
+        event arrives or the timeout expires.
+        """
+        if self.mode == MODE_WAIT:
+            first = pygame.event.wait(EVENT_WAIT_TIMEOUT_MS)
+            if first.type == pygame.NOEVENT:
+                return []
+            return [first] + pygame.event.get()
+        return pygame.event.get()
+
+    def tick(self, events, presented):
+        now = time.monotonic()
+        if events or presented:
+            self.last_activity = now
+        self.check_thermal(now)
+
+        idle_for = now - self.last_activity
+        if idle_for >= EVENT_WAIT_AFTER_SECS:
+            self.set_mode(MODE_WAIT)
+        elif idle_for >= IDLE_AFTER_SECS:
+            self.set_mode(MODE_IDLE)
+        else:
+            self.set_mode(MODE_ACTIVE)
+
+        if self.mode == MODE_WAIT:
+            # The wait in get_events() already did the throttling
+            self.clock.tick()
+        else:
+            self.clock.tick(self.target_fps())
+
+        self.window_frames += 1
+        if presented:
+            self.window_presented += 1
+        elapsed = now - self.window_start
+        if elapsed >= 1.0:
+            self.loop_fps = self.window_frames / elapsed
+            self.presented_fps = self.window_presented / elapsed
+            self.window_start = now
+            self.window_frames = 0
+            self.window_presented = 0
+
+    def is_idle(self):
+        return self.mode != MODE_ACTIVE
+
+    def target_fps(self):
+        if self.mode == MODE_WAIT:
+            return 1000 // EVENT_WAIT_TIMEOUT_MS
+        fps = IDLE_FPS if self.mode == MODE_IDLE else FPS
+        if self.thermal_capped:
+            fps = min(fps, THERMAL_FPS)
+        return fps
+
+    def set_mode(self, mode):
+        if mode != self.mode:
+            log(f"Frame scheduler: {self.mode} -> {mode} ({self.describe()})")
+            self.mode = mode
+
+    def check_thermal(self, now):
+        if now - self.last_thermal_check < THERMAL_CHECK_SECS:
+            return
+        self.last_thermal_check = now
+        self.temperature = read_temperature()
+        if self.temperature is None:
+            return
+        if not self.thermal_capped and self.temperature >= THERMAL_LIMIT_C:
+            self.thermal_capped = True
+            log(f"Frame scheduler: {self.temperature:.1f}C, capping at {THERMAL_FPS} fps")
+        elif self.thermal_capped and self.temperature < THERMAL_RELEASE_C:
+            self.thermal_capped = False
+            log(f"Frame scheduler: {self.temperature:.1f}C, thermal cap lifted")
+
+    def stats(self):
+        return {
+            "mode": self.mode,
+            "target_fps": self.target_fps(),
+            "loop_fps": round(self.loop_fps, 1),
+            "presented_fps": round(self.presented_fps, 1),
+            "thermal_capped": self.thermal_capped,
+            "temperature": self.temperature,
+        }
+
+    def describe(self):
+        s = self.stats()
+        return (f"target {s['target_fps']} fps, loop {s['loop_fps']} fps, "
+                f"presented {s['presented_fps']} fps, temp {s['temperature']}")
+
+
+def read_temperature():
+    """Hottest thermal zone in degrees C, or None if sysfs isn't there."""
+    temps = []
+    for path in glob.glob(THERMAL_ZONE_GLOB):
+        try:
+            with open(path) as f:
+                temps.append(int(f.read().strip()) / 1000.0)
+        except (OSError, ValueError):
+            continue
+    return max(temps) if temps else None
@@ -0,0 +1,176 @@
+"""
+Glyph-atlas text rendering for the wizard's pixel fonts.
+
+Each (font, color) gets an atlas: every printable ASCII glyph rasterized
+once side by side into one surface. A string is then composed with a single
+Surface.blits() call instead of a FreeType pass. Text with characters the
+atlas doesn't hold (or non-antialiased text) falls back to font.render.
+
+Compare it with font.render on SSID-like and terms lines with:
+
+    python -m arcade_wizard.glyph_atlas [--rounds N]
+"""
+import os
+import sys
+import time
+import string
+import argparse
+
+import pygame
+
+ATLAS_CHARSET = string.digits + string.ascii_letters + string.punctuation + " "
+
+# font -> {color: GlyphAtlas}, only for fonts registered with enable()
+atlases = {}
+
+
+class GlyphAtlas:
+    """All glyphs of one font in one color, packed left to right."""
+
+    def __init__(self, font, color, charset=ATLAS_CHARSET):
+        self.font = font
+        self.color = tuple(color)
+        self.height = font.get_height()
+        self.areas = {}
+
+        glyphs = []
+        x = 0
+        for ch in charset:
+            glyph = font.render(ch, True, color)
+            self.areas[ch] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            glyphs.append((glyph, (x, 0)))
+            x += glyph.get_width()
+            self.height = max(self.height, glyph.get_height())
+
+        self.surface = pygame.Surface((max(x, 1), self.height), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blits(glyphs, doreturn=False)
+
+    def covers(self, text):
+        areas = self.areas
+        return all(ch in areas for ch in text)
+
+    def render(self, text):
+        """Compose text from the atlas. The caller checks covers() first."""
+        areas = self.areas
+        width = sum(areas[ch].width for ch in text)
+        # Some fonts render shorter lines for strings without descenders
+        height = self.font.size(text)[1]
+        out = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+        # Transparent pixels carry the text color, so alpha-blending the
+        # glyphs in gives the same colour and coverage font.render would.
+        out.fill(self.color + (0,))
+
+        seq = []
+        x = 0
+        for ch in text:
+            area = areas[ch]
+            seq.append((self.surface, (x, 0), area))
+            x += area.width
+        out.blits(seq, doreturn=False)
+        return out
+
+
+def enable(font):
+    """Render this font through glyph atlases from now on."""
+    atlases.setdefault(font, {})
+
+
+def atlas_for(font, color):
+    by_color = atlases.get(font)
+    if by_color is None:
+        return None
+    color = tuple(color)
+    atlas = by_color.get(color)
+    if atlas is None:
+        atlas = by_color[color] = GlyphAtlas(font, color)
+    return atlas
+
+
+def render(font, text, color, antialias=True):
+    """
+    Like font.render(text, antialias, color), composed from an atlas when the
+    font is enabled and every character is in it.
+    """
+    if antialias and text and len(color) == 3:
+        atlas = atlas_for(font, color)
+        if atlas and atlas.covers(text):
+            return atlas.render(text)
+    return font.render(text, antialias, color)
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARK
+# -----------------------------------------------------------------------------
+SAMPLE_SSIDS = [
+    "MyHomeWiFi", "NETGEAR42-5G", "Simple Arcades Guest", "xfinitywifi",
+    "DIRECT-7A-HP OfficeJet", "TP-Link_3F2C", "Linksys00042", "CONNECTED",
+]
+
+
+def sample_terms_lines(base_dir, limit=40):
+    path = os.path.join(base_dir, "terms_and_conditions.txt")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+    except OSError:
+        lines = []
+    # Terms lines are wrapped to roughly this many characters on screen
+    return [line[:90] for line in lines[:limit]] or ["Arcade Use & Disclaimer"]
+
+
+def time_renders(render_fn, lines, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for line in lines:
+            render_fn(line)
+    return (time.perf_counter() - start) * 1e6 / (rounds * len(lines))
+
+
+def same_pixels(a, b):
+    if a.get_size() != b.get_size():
+        return False
+    a = a.convert_alpha()
+    b = b.convert_alpha()
+    return pygame.image.tobytes(a, "RGBA") == pygame.image.tobytes(b, "RGBA")
+
+
+def main(argv=None):
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Compare glyph-atlas text rendering with font.render.")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    fonts = [
+        ("NES 24", os.path.join(base_dir, "fonts", "NESCyrillic_gamelist.ttf"), 24),
+        ("NES 20", os.path.join(base_dir, "fonts", "NESCyrillic_gamelist.ttf"), 20),
+        ("TINY 34", os.path.join(base_dir, "fonts", "TinyUnicode.ttf"), 34),
+        ("TINY 20", os.path.join(base_dir, "fonts", "TinyUnicode.ttf"), 20),
+    ]
+    samples = [("ssid", SAMPLE_SSIDS), ("terms", sample_terms_lines(base_dir))]
+    color = (0, 0, 0)
+
+    print(f"{'font':<8} {'lines':<6} {'font.render us':>15} {'atlas us':>9} {'speedup':>8}  match")
+    for name, path, size in fonts:
+        font = pygame.font.Font(path, size)
+        build_start = time.perf_counter()
+        atlas = GlyphAtlas(font, color)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        for kind, lines in samples:
+            covered = [line for line in lines if atlas.covers(line)]
+            ft_us = time_renders(lambda t: font.render(t, True, color), covered, args.rounds)
+            atlas_us = time_renders(atlas.render, covered, args.rounds)
+            match = all(same_pixels(font.render(t, True, color), atlas.render(t)) for t in covered)
+            print(f"{name:<8} {kind:<6} {ft_us:>15.1f} {atlas_us:>9.1f} {ft_us / atlas_us:>7.2f}x  "
+                  f"{'yes' if match else 'NO'}")
+        print(f"{name:<8} atlas built in {build_ms:.1f} ms ({atlas.surface.get_width()}x{atlas.height})")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Input-to-photon latency.
+
+Enabled with WIZARD_INPUT_LATENCY=1. Application.run stamps each frame's
+events when it reads them. Screens handle input, update and render in that
+same loop iteration, so a press that reaches a screen (a KEYDOWN, including
+synthesized pad/stick ones and auto-repeats, or a mouse click) first shows
+in that frame's display update: the time from the read to the end of it is
+the press's latency. If the frame presents nothing the press is counted as
+having no visible effect. show_message() blocks inside a screen's handler
+with its own event loop; it closes out the pending presses at its first
+display update and tracks the presses it reads the same way.
+
+Samples are kept per (screen, source), source being keyboard, joystick or
+mouse. A screen's distributions are logged when the wizard leaves it, and
+all of them on exit, together with the mixer settings, so runs with a
+different input pipeline or mixer buffer can be compared.
+
+Time an event spends in SDL's queue before the read isn't visible to
+pygame, so it is not included.
+"""
+import os
+import time
+from collections import deque
+
+import pygame
+
+from .constants import INPUT_LATENCY_ENV, INPUT_LATENCY_WINDOW
+from .utils import log
+from .frame_hud import percentile
+
+enabled = bool(os.environ.get(INPUT_LATENCY_ENV))
+
+samples = {}   # (screen, source) -> deque of latencies in ms
+pending = []   # (read time, screen, source) handled this frame
+no_effect = {} # (screen, source) -> presses that never showed
+_read_time = None
+_last_screen = None
+
+
+def event_source(e):
+    source = getattr(e, "source", None)
+    if source:
+        return source
+    if e.type == pygame.MOUSEBUTTONDOWN:
+        return "mouse"
+    return "keyboard"
+
+
+def events_read():
+    """Call right after the frame's events were taken from the queue."""
+    global _read_time
+    if enabled:
+        _read_time = time.perf_counter()
+
+
+def track(events, screen_name):
+    """events as handed to the screen (after the input mapper)."""
+    if not enabled:
+        return
+    for e in events:
+        if e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            pending.append((_read_time, screen_name, event_source(e)))
+
+
+def frame_done(screen_name, presented):
+    """Call after pygame.display.update (presented=False if it was skipped)."""
+    global _last_screen
+    if not enabled:
+        return
+    now = time.perf_counter()
+    for read, screen, source in pending:
+        key = (screen, source)
+        if presented:
+            if key not in samples:
+                samples[key] = deque(maxlen=INPUT_LATENCY_WINDOW)
+            samples[key].append((now - read) * 1000)
+        else:
+            no_effect[key] = no_effect.get(key, 0) + 1
+    pending.clear()
+
+    if screen_name != _last_screen:
+        if _last_screen is not None:
+            log_screen(_last_screen)
+        _last_screen = screen_name
+
+
+def describe(values, missed):
+    values = sorted(values)
+    return (f"n={len(values)} p50/p95/p99/max "
+            f"{percentile(values, 50):.1f}/{percentile(values, 95):.1f}/"
+            f"{percentile(values, 99):.1f}/{max(values, default=0):.1f} ms"
+            f"{f', {missed} with no visible effect' if missed else ''}")
+
+
+def log_screen(screen_name):
+    for screen, source in sorted(set(samples) | set(no_effect)):
+        if screen == screen_name:
+            values = samples.get((screen, source), ())
+            log(f"Input latency [{screen}/{source}]: {describe(values, no_effect.get((screen, source), 0))}")
+
+
+def log_summary(mixer_buffer=None):
+    if not enabled:
+        return
+    if _last_screen is not None:
+        log_screen(_last_screen)
+    by_source = {source: [] for _, source in no_effect}
+    for (_, source), values in samples.items():
+        by_source.setdefault(source, []).extend(values)
+    for source, values in sorted(by_source.items()):
+        missed = sum(n for (_, s), n in no_effect.items() if s == source)
+        log(f"Input latency [all/{source}]: {describe(values, missed)}")
+    mixer = pygame.mixer.get_init()
+    if mixer:
+        log(f"Input latency: mixer {mixer[0]} Hz, {mixer[2]} channels, buffer {mixer_buffer}")
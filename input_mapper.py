@@ -0,0 +1,194 @@
+"""
+The one place raw SDL input becomes what screens handle.
+
+Screens speak in arrow keys plus Enter/Escape/Tab, so that is the action
+vocabulary: pad buttons, the hat, the analog stick and the keyboard arrows
+all come out as KEYDOWN/KEYUP events for those keys.
+  - keyboard, hat and button presses come out where they were in the
+    queue, one KEYDOWN per press, so Down then Enter is handled in that order
+  - stick axis events are coalesced per axis per frame (last value, plus
+    the peak so a flick that returns within one frame still counts) and
+    handled at the end of the frame; a direction presses past
+    INPUT_AXIS_PRESS but releases only below INPUT_AXIS_RELEASE, so a stick
+    resting near the threshold doesn't chatter
+  - a held direction (from any source) repeats after INPUT_REPEAT_DELAY_MS,
+    then every INPUT_REPEAT_INTERVAL_MS; it is released once no device holds it
+  - mouse motion is coalesced to the frame's last motion event, kept at its
+    place in the queue
+Synthesized events carry repeat=True on auto-repeats and a source
+("keyboard" or "joystick") for input_latency. Everything else
+(mouse buttons, other keys, QUIT) passes through unchanged.
+"""
+import time
+
+import pygame
+
+from .constants import INPUT_AXIS_PRESS, INPUT_AXIS_RELEASE, INPUT_REPEAT_DELAY_MS, INPUT_REPEAT_INTERVAL_MS
+from .event_bus import event_bus
+from .utils import log
+
+DIRECTION_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
+
+# axis -> (key for negative values, key for positive values)
+STICK_AXES = {
+    0: (pygame.K_LEFT, pygame.K_RIGHT),
+    1: (pygame.K_UP, pygame.K_DOWN),
+}
+
+# A => Enter, B => Escape, X => Tab
+BUTTON_KEYS = {0: pygame.K_RETURN, 1: pygame.K_ESCAPE, 2: pygame.K_TAB}
+
+# Everything else (text input, window focus, audio devices...) never reaches the queue
+ALLOWED_EVENTS = [
+    pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.JOYAXISMOTION, pygame.JOYHATMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+]
+
+
+def hat_directions(value):
+    x, y = value
+    held = set()
+    if x < 0:
+        held.add(pygame.K_LEFT)
+    elif x > 0:
+        held.add(pygame.K_RIGHT)
+    # Hat y is positive for up
+    if y > 0:
+        held.add(pygame.K_UP)
+    elif y < 0:
+        held.add(pygame.K_DOWN)
+    return held
+
+
+def key_event(event_type, key, source, repeat=False):
+    return pygame.event.Event(event_type, key=key, mod=0, unicode="", scancode=0, repeat=repeat, source=source)
+
+
+class InputMapper:
+    def __init__(self):
+        self.stick = set()  # directions held on the stick, after hysteresis
+        self.hat = set()
+        self.keys = set()   # arrow keys held on the keyboard
+        self.sources = {}   # direction -> device that last pressed it
+        # Held direction -> monotonic time of its next repeat, or None
+        # while its repeats are suppressed (see flush)
+        self.held = {}
+
+        self.raw_events = 0
+        self.coalesced = 0
+        self.actions = 0
+        self.repeats = 0
+
+    def install(self):
+        """Only let input we handle (and event bus messages) into SDL's queue."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS + event_bus.event_types())
+
+    def process(self, events, now=None):
+        """Turn one frame's raw events into the events screens handle, in queue order."""
+        now = time.monotonic() if now is None else now
+        out = []
+        axes = {}
+        motion_at = None  # index in out of this frame's mouse motion
+        for e in events:
+            self.raw_events += 1
+            if e.type == pygame.JOYAXISMOTION:
+                if e.axis in STICK_AXES:
+                    if e.axis in axes:
+                        self.coalesced += 1
+                        _, lo, hi = axes[e.axis]
+                        axes[e.axis] = (e.value, min(lo, e.value), max(hi, e.value))
+                    else:
+                        axes[e.axis] = (e.value, e.value, e.value)
+            elif e.type == pygame.MOUSEMOTION:
+                if motion_at is not None:
+                    self.coalesced += 1
+                    del out[motion_at]
+                motion_at = len(out)
+                out.append(e)
+            elif e.type == pygame.JOYHATMOTION:
+                hat = hat_directions(e.value)
+                old, self.hat = self.hat, hat
+                for key in DIRECTION_KEYS:
+                    if key in hat and key not in old:
+                        self.press(key, "joystick", now, out)
+                    elif key in old and key not in hat:
+                        self.release(key, out)
+            elif e.type in (pygame.KEYDOWN, pygame.KEYUP) and e.key in DIRECTION_KEYS:
+                if e.type == pygame.KEYDOWN:
+                    self.keys.add(e.key)
+                    self.press(e.key, "keyboard", now, out)
+                else:
+                    self.keys.discard(e.key)
+                    self.release(e.key, out)
+            elif e.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+                key = BUTTON_KEYS.get(e.button)
+                if key is not None:
+                    kind = pygame.KEYDOWN if e.type == pygame.JOYBUTTONDOWN else pygame.KEYUP
+                    out.append(key_event(kind, key, "joystick"))
+                    self.actions += 1
+            else:
+                out.append(e)
+
+        # The coalesced stick, then auto-repeats, close the frame
+        for axis, (value, lo, hi) in axes.items():
+            self.update_stick(axis, value, lo, hi, now, out)
+        self.repeat_events(now, out)
+        return out
+
+    def press(self, key, source, now, out):
+        self.sources[key] = source
+        self.held[key] = now + INPUT_REPEAT_DELAY_MS / 1000.0
+        out.append(key_event(pygame.KEYDOWN, key, source))
+        self.actions += 1
+
+    def release(self, key, out):
+        """Key up once no device holds the direction any more."""
+        if key in self.held and key not in self.stick | self.hat | self.keys:
+            del self.held[key]
+            out.append(key_event(pygame.KEYUP, key, self.sources.get(key, "keyboard")))
+
+    def update_stick(self, axis, value, lo, hi, now, out):
+        negative, positive = STICK_AXES[axis]
+        for key, peak, last in ((negative, -lo, -value), (positive, hi, value)):
+            if key not in self.stick and peak > INPUT_AXIS_PRESS:
+                self.stick.add(key)
+                # Already held on the hat or keyboard: one press, one repeat timer
+                if key not in self.held:
+                    self.press(key, "joystick", now, out)
+            if key in self.stick and last < INPUT_AXIS_RELEASE:
+                self.stick.discard(key)
+                self.release(key, out)
+
+    def repeat_events(self, now, out):
+        pressed = self.stick | self.hat | self.keys
+        for key in DIRECTION_KEYS:
+            if key not in pressed:
+                self.release(key, out)
+            elif self.held.get(key) is not None and now >= self.held[key]:
+                self.held[key] = now + INPUT_REPEAT_INTERVAL_MS / 1000.0
+                out.append(key_event(pygame.KEYDOWN, key, self.sources.get(key, "keyboard"), repeat=True))
+                self.actions += 1
+                self.repeats += 1
+
+    def is_holding(self):
+        """True while a direction is held, i.e. auto-repeat may still fire."""
+        return any(t is not None for t in self.held.values())
+
+    def flush(self):
+        """
+        After a screen change: directions still held don't repeat into the
+        new screen until they are released and pressed again.
+        """
+        for key in self.held:
+            self.held[key] = None
+
+    def describe(self):
+        return (f"{self.raw_events} raw events, {self.coalesced} coalesced, "
+                f"{self.actions} actions ({self.repeats} auto-repeats)")
+
+    def log_stats(self):
+        log(f"Input: {self.describe()}")
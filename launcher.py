@@ -0,0 +1,44 @@
+"""
+Thin entry point: python -m arcade_wizard [--force] [--boot-profile]
+
+Only the standard library is imported until we know the wizard will run,
+so cabinets that already finished setup exit without loading pygame.
+"""
+import os
+import sys
+import argparse
+
+from .constants import SETUP_COMPLETE_FLAG, BOOT_PROFILE_ENV
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="arcade_wizard", description="Arcade setup wizard")
+    parser.add_argument("--force", action="store_true",
+                        help="run even if setup was already completed")
+    parser.add_argument("--boot-profile", action="store_true",
+                        help="log a startup timeline (same as WIZARD_BOOT_PROFILE=1)")
+    return parser.parse_args(argv)
+
+
+def already_completed():
+    if os.path.exists(SETUP_COMPLETE_FLAG):
+        print("Setup wizard already completed.")
+        return True
+    return False
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.force and already_completed():
+        return 0
+    if args.boot_profile:
+        os.environ[BOOT_PROFILE_ENV] = "1"
+
+    # Only now pay for pygame and the screens
+    from .main import main as run_wizard
+    run_wizard()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
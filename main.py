@@ -1,5 +1,9 @@
 import os
 import sys
+import time
+
+from . import boot_profile
+boot_profile.mark("interpreter startup")
 
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 
@@ -14,71 +18,128 @@ finally:
     # Restore original stderr
     sys.stderr = _original_stderr
     devnull.close()
+boot_profile.mark("import pygame")
 
 # Now proceed normally
 import warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning, module='pygame')
 
-import pygame
-
 from .constants import (
-    PHYSICAL_WIDTH, PHYSICAL_HEIGHT, FPS,
-    SETUP_COMPLETE_FLAG, APP_LOG_FILE
+    PHYSICAL_WIDTH, PHYSICAL_HEIGHT,
+    APP_LOG_FILE, ASSET_PACK_FILE, GLYPH_ATLAS_ENABLED,
+    MIXER_FREQUENCY, MIXER_BUFFER, MIXER_BUFFER_ENV
 )
 from .utils import log
 from .screen_manager import ScreenManager
+from .assets import AssetManager
+from .asset_pack import AssetPack
+from .frame_scheduler import FrameScheduler
+from .frame_hud import FrameHud
+from .text_cache import text_cache
+from . import glyph_atlas, alloc_debug, input_latency
+from .event_bus import event_bus
+from .input_mapper import InputMapper
+from .network_backend import make_backend, ScanScheduler
 from .screens.welcome_screen import WelcomeScreen
 from .screens.timezone_screen import EnterTimezoneScreen
 from .screens.terms_screen import TermsScreen
 from .screens.wifi_screen import WiFiScreen
 from .screens.update_screen import UpdateScreen
 from .screens.final_screen import FinalScreen
+boot_profile.mark("import wizard modules")
 
 class Application:
+    # Assets loaded by __init__, declared for the asset pack build step
+    IMAGES = [
+        ("background_lg.png", (PHYSICAL_WIDTH, PHYSICAL_HEIGHT), False),
+        ("bubble_lg.png", None),
+    ]
+    SOUNDS = ["background_music.ogg"]
+    FONTS = ["NESCyrillic_gamelist.ttf", "TinyUnicode.ttf"]
+
     def __init__(self):
         # ensure logs directory
         os.makedirs(os.path.dirname(APP_LOG_FILE), exist_ok=True)
+        boot_profile.mark("create log dir")
 
-        pygame.mixer.pre_init(48000, -16, 2, 4096)
+        try:
+            self.mixer_buffer = int(os.environ.get(MIXER_BUFFER_ENV, MIXER_BUFFER))
+        except ValueError:
+            log(f"Bad {MIXER_BUFFER_ENV} value, using {MIXER_BUFFER}")
+            self.mixer_buffer = MIXER_BUFFER
+        pygame.mixer.pre_init(MIXER_FREQUENCY, -16, 2, self.mixer_buffer)
         pygame.init()
+        boot_profile.mark("pygame.init")
         pygame.mixer.init()
+        boot_profile.mark("pygame.mixer.init")
         
         # Hide the mouse cursor
         pygame.mouse.set_visible(False)
 
         self.display_surf = pygame.display.set_mode((PHYSICAL_WIDTH, PHYSICAL_HEIGHT))
         pygame.display.set_caption("Arcade Setup Wizard")
+        boot_profile.mark("display.set_mode")
 
-        self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler()
+        # Pad, stick and keyboard input all reach screens through this
+        self.input = InputMapper()
+        self.input.install()
 
         # We'll record our base_dir for get_path
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
 
+        # Shared image/sound/font cache used by every screen, backed by the
+        # pre-baked asset pack when one has been built
+        pack = AssetPack.open(self.get_path(ASSET_PACK_FILE), self.base_dir)
+        self.assets = AssetManager(pack=pack)
+        boot_profile.mark("open asset pack")
+
+        # Decode the background, bubble and first page on all cores at once
+        self.screen_manager = ScreenManager(self)
+        self.screen_manager.preload_images(Application, WelcomeScreen)
+        boot_profile.mark("preload images")
+
         # Load fonts from arcade_wizard/fonts/
         try:
             nes_font_path_24 = self.get_path("fonts","NESCyrillic_gamelist.ttf")
             tiny_font_path_24 = self.get_path("fonts","TinyUnicode.ttf")
-            self.font_NES_24 = pygame.font.Font(nes_font_path_24, 24)
-            self.font_NES_20 = pygame.font.Font(nes_font_path_24, 20)
-            self.font_TINY_24 = pygame.font.Font(tiny_font_path_24, 34)
-            self.font_TINY_20 = pygame.font.Font(tiny_font_path_24, 20)
+            self.font_NES_24 = self.assets.font(nes_font_path_24, 24)
+            self.font_NES_20 = self.assets.font(nes_font_path_24, 20)
+            self.font_TINY_24 = self.assets.font(tiny_font_path_24, 34)
+            self.font_TINY_20 = self.assets.font(tiny_font_path_24, 20)
+            if GLYPH_ATLAS_ENABLED:
+                for font in (self.font_NES_24, self.font_NES_20, self.font_TINY_24, self.font_TINY_20):
+                    glyph_atlas.enable(font)
         except Exception as e:
             log(f"Failed to load fonts: {e}")
             self.font_NES_24 = pygame.font.SysFont(None,24)
             self.font_NES_20 = pygame.font.SysFont(None,20)
             self.font_TINY_24 = pygame.font.SysFont(None,24)
             self.font_TINY_20 = pygame.font.SysFont(None,20)
+        # pygame's default font, for the OSK prompt and show_message()
+        self.font_PROMPT_48 = self.assets.font(None, 48)
+        self.font_MESSAGE_56 = self.assets.font(None, 56)
+        boot_profile.mark("load fonts")
+
+        # Debug frame-time overlay (F3 / Select+Start, or WIZARD_FRAME_HUD=1)
+        self.frame_hud = FrameHud(self.font_NES_20)
 
         # Load background / bubble
         self.background = self.load_bg(self.get_path("images","background_lg.png"))
         self.bubble_image = self.load_bubble(self.get_path("images","bubble_lg.png"))
         self.bubble_rect = self.bubble_image.get_rect(center=(PHYSICAL_WIDTH//2, PHYSICAL_HEIGHT//2))
+        boot_profile.mark("load background/bubble")
 
         # Load music
         self.load_music(self.get_path("sounds","background_music.ogg"))
+        boot_profile.mark("load music")
+
+        # Wi-Fi goes through a backend so it can be swapped for a simulated one
+        self.network_backend = make_backend()
+        self.scan_scheduler = ScanScheduler(self.network_backend)
 
-        self.screen_manager = ScreenManager(self)
         self.register_screens()
+        boot_profile.mark("register screens")
 
         pygame.joystick.init()
         jc = pygame.joystick.get_count()
@@ -89,6 +150,7 @@ class Application:
         else:
             self.joystick=None
             log("No joystick detected.")
+        boot_profile.mark("joystick init")
 
     def get_path(self, *subdirs):
         """
@@ -99,9 +161,7 @@ class Application:
 
     def load_bg(self, path):
         try:
-            img = pygame.image.load(path).convert()
-            img = pygame.transform.scale(img, (PHYSICAL_WIDTH, PHYSICAL_HEIGHT))
-            return img
+            return self.assets.image(path, (PHYSICAL_WIDTH, PHYSICAL_HEIGHT), alpha=False)
         except Exception as e:
             log(f"Failed to load background image {path}: {e}")
             tmp = pygame.Surface((PHYSICAL_WIDTH, PHYSICAL_HEIGHT))
@@ -110,8 +170,7 @@ class Application:
 
     def load_bubble(self, path):
         try:
-            img = pygame.image.load(path).convert_alpha()
-            return img
+            return self.assets.image(path)
         except Exception as e:
             log(f"Failed to load bubble image {path}: {e}")
             tmp = pygame.Surface((600,400), pygame.SRCALPHA)
@@ -130,37 +189,78 @@ class Application:
             log(f"Music file not found: {path}")
 
     def register_screens(self):
-        welcome = WelcomeScreen(self)
-        timezone = EnterTimezoneScreen(self)
-        terms = TermsScreen(self)
-        wifi = WiFiScreen(self)
-        update = UpdateScreen(self)
-        final = FinalScreen(self)
-
-        self.screen_manager.register_screen("welcome", welcome)
-        self.screen_manager.register_screen("timezone", timezone)
-        self.screen_manager.register_screen("terms", terms)
-        self.screen_manager.register_screen("wifi", wifi)
-        self.screen_manager.register_screen("update", update)
-        self.screen_manager.register_screen("final", final)
+        # Nothing is built until change_screen() first targets it. "update"
+        # isn't pre-built because constructing it launches the update script.
+        # There is no way back from "update"/"final", so they're exclusive.
+        self.screen_manager.register_screen("welcome", WelcomeScreen, next_screen="timezone")
+        self.screen_manager.register_screen("timezone", EnterTimezoneScreen, next_screen="terms")
+        self.screen_manager.register_screen("terms", TermsScreen, next_screen="wifi")
+        self.screen_manager.register_screen("wifi", WiFiScreen)
+        self.screen_manager.register_screen("update", UpdateScreen, next_screen="final", exclusive=True)
+        self.screen_manager.register_screen("final", FinalScreen, exclusive=True)
 
         self.screen_manager.change_screen("welcome")
 
     def run(self):
         running = True
+        first_frame = True
         while running:
-            events = pygame.event.get()
+            raw_events = self.frame_scheduler.get_events()
+            input_latency.events_read()
+            # Worker results are handled here; screens only see input
+            events = event_bus.dispatch(raw_events)
+            self.frame_hud.handle_events(events, self.joystick)
+            events = self.input.process(events)
             for e in events:
                 if e.type == pygame.QUIT:
                     running=False
+            if not running:
+                # Screens would exit on QUIT themselves, skipping the summaries below
+                break
+            screen_name = self.screen_manager.active_name
+            input_latency.track(events, screen_name)
 
+            t_events = time.perf_counter()
             self.screen_manager.handle_events(events)
+            t_update = time.perf_counter()
             self.screen_manager.update()
-            self.screen_manager.render(self.display_surf)
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
+            t_render = time.perf_counter()
+
+            hud_rect = self.frame_hud.repaint_rect()
+            if hud_rect:
+                self.screen_manager.mark_dirty(hud_rect)
+            dirty = self.screen_manager.render(self.display_surf)
+            dirty = self.frame_hud.overlay(self.display_surf, dirty)
+            t_flip = time.perf_counter()
+
+            # Only push what the scene repainted; skip presenting if nothing did
+            if dirty:
+                pygame.display.update(dirty)
+            t_done = time.perf_counter()
+            input_latency.frame_done(screen_name, bool(dirty))
+            if first_frame:
+                boot_profile.finish()
+                first_frame = False
+
+            self.frame_hud.record(
+                screen_name,
+                (t_update - t_events) * 1000, (t_render - t_update) * 1000,
+                (t_flip - t_render) * 1000, (t_done - t_flip) * 1000,
+            )
+            # A held direction is input too: it keeps auto-repeating
+            self.frame_scheduler.tick(raw_events or self.input.is_holding(), bool(dirty))
+
+            if self.frame_scheduler.is_idle():
+                self.screen_manager.prebuild_next()
+            alloc_debug.frame_done(screen_name)
+
+        if self.frame_hud.enabled:
+            self.frame_hud.log_summary()
+        text_cache.log_stats()
+        event_bus.log_stats()
+        self.input.log_stats()
+        input_latency.log_summary(self.mixer_buffer)
+        alloc_debug.log_summary()
         pygame.quit()
         sys.exit()
 
@@ -204,16 +304,15 @@ class Application:
         sys.exit()
 
 def main():
-    from .constants import SETUP_COMPLETE_FLAG
-    import os
-
-    if os.path.exists(SETUP_COMPLETE_FLAG):
-        print("Setup wizard already completed.")
-        sys.exit(0)
-
+    """Run the wizard. The completion-flag check lives in launcher.py."""
     log("Launching setup application.")
+    alloc_debug.install()
     app = Application()
     app.run()
 
 if __name__=="__main__":
+    # Prefer `python -m arcade_wizard`, which checks the flag before importing pygame
+    from .launcher import already_completed
+    if already_completed():
+        sys.exit(0)
     main()
\ No newline at end of file
@@ -0,0 +1,387 @@
+"""
+Wi-Fi backends for the wizard.
+
+NmcliBackend drives NetworkManager through nmcli; FakeBackend simulates a
+crowded neighbourhood (hundreds of SSIDs, configurable latency) for
+benchmarks and for running the wizard on a machine without Wi-Fi. Select
+the fake with WIZARD_NETWORK_BACKEND=fake[:count[:latency_secs]].
+
+Every call blocks, so screens run them on a worker thread; scans go through
+ScanScheduler. Networks are network_model.WifiNetwork, one per SSID.
+  cached_scan() -> (networks, connected_ssid)   whatever is known right now
+  scan()        -> (networks, connected_ssid)   after a fresh scan completes
+  known_ssids() -> set of SSIDs with a saved profile
+  connect(ssid, password) -> (ok, message)
+  activate(ssid)  -> (ok, message)   bring up the saved profile, no password
+  wait_for_ip(timeout) -> the Wi-Fi interface's IPv4 address, or None
+"""
+import os
+import time
+import random
+import threading
+import subprocess
+
+from .constants import (
+    NETWORK_BACKEND_ENV, NMCLI_PATH, SCAN_TIMEOUT_SECS, CONNECT_TIMEOUT_SECS, SCAN_MIN_INTERVAL_SECS,
+    IP_WAIT_SECS, WIFI_SCAN_CACHE_FILE, WIFI_SCAN_CACHE_TTL_SECS
+)
+from .utils import log
+from .network_model import (
+    WifiNetwork, NMCLI_FIELDS, parse_wifi_list, split_terse,
+    read_scan_cache, networks_from_cache, save_scan_cache
+)
+
+
+class NetworkBackend:
+    name = "none"
+
+    def cached_scan(self):
+        return [], None
+
+    def scan(self):
+        return self.cached_scan()
+
+    def known_ssids(self):
+        return set()
+
+    def connect(self, ssid, password):
+        return False, "No network backend"
+
+    def activate(self, ssid):
+        return False, "No network backend"
+
+    def wait_for_ip(self, timeout=IP_WAIT_SECS):
+        return None
+
+
+class NmcliBackend(NetworkBackend):
+    name = "nmcli"
+
+    def __init__(self, nmcli=NMCLI_PATH):
+        self.nmcli = nmcli
+        self.wifi_device = None
+        self.profiles = {}  # SSID -> profile UUID, from the last saved_profiles()
+
+    def list_networks(self, rescan):
+        # With --rescan yes nmcli itself waits for NetworkManager to report
+        # the scan finished, so there is no fixed sleep on our side.
+        output = self.run_nmcli(
+            ["-t", "-f", ",".join(NMCLI_FIELDS), "device", "wifi", "list", "--rescan", rescan],
+            SCAN_TIMEOUT_SECS,
+        )
+        return parse_wifi_list(output)
+
+    def run_nmcli(self, args, timeout):
+        p = subprocess.run([self.nmcli] + args, capture_output=True, text=True, timeout=timeout)
+        if p.returncode != 0:
+            raise subprocess.CalledProcessError(p.returncode, p.args, p.stdout, p.stderr)
+        return p.stdout
+
+    def cached_scan(self):
+        return self.list_networks("no")
+
+    def scan(self):
+        try:
+            return self.list_networks("yes")
+        except subprocess.CalledProcessError as e:
+            # NetworkManager refuses scans that come too soon after the last
+            # one; the list it already has is the freshest there is.
+            log(f"nmcli rescan refused (RC={e.returncode}): {(e.stderr or '').strip()}")
+            return self.cached_scan()
+
+    def saved_profiles(self):
+        """
+        SSID -> UUID of a saved Wi-Fi profile for it. Profile names are free
+        text (renamed by hand, or NM's "MyNet 1" duplicates), so the SSID is
+        read from each profile's settings.
+        """
+        output = self.run_nmcli(["-t", "-f", "UUID,TYPE", "connection", "show"], SCAN_TIMEOUT_SECS)
+        profiles = {}
+        for line in output.splitlines():
+            parts = split_terse(line)
+            if len(parts) == 2 and parts[1] in ("802-11-wireless", "wifi"):
+                value = self.run_nmcli(
+                    ["-g", "802-11-wireless.ssid", "connection", "show", "uuid", parts[0]], SCAN_TIMEOUT_SECS
+                )
+                # -g escapes ':' like -t does
+                ssid = ":".join(split_terse(value.rstrip("\n")))
+                if ssid:
+                    profiles.setdefault(ssid, parts[0])
+        self.profiles = profiles
+        return profiles
+
+    def known_ssids(self):
+        try:
+            return set(self.saved_profiles())
+        except Exception as e:
+            log(f"Could not list saved connections: {e}")
+            return set()
+
+    def connect(self, ssid, password):
+        cmd = [self.nmcli, "dev", "wifi", "connect", ssid, "password", password]
+        try:
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=CONNECT_TIMEOUT_SECS, check=True)
+            if "successfully activated" in res.stdout:
+                return True, ssid
+            # Maybe it succeeded but no mention
+            return False, f"Failed: {res.stdout}"
+        except subprocess.CalledProcessError as cpe:
+            return False, f"nmcli failed (RC={cpe.returncode}): {cpe.stderr or cpe.stdout}"
+        except subprocess.TimeoutExpired:
+            return False, "Connection timed out."
+
+    def activate(self, ssid):
+        try:
+            uuid = self.profiles.get(ssid)
+            if uuid is None:
+                uuid = self.saved_profiles().get(ssid)
+            if uuid is None:
+                return False, f"No saved profile for {ssid}"
+            self.run_nmcli(["connection", "up", "uuid", uuid], CONNECT_TIMEOUT_SECS)
+            return True, ssid
+        except subprocess.CalledProcessError as cpe:
+            return False, f"nmcli failed (RC={cpe.returncode}): {cpe.stderr or cpe.stdout}"
+        except subprocess.TimeoutExpired:
+            return False, "Connection timed out."
+
+    def find_wifi_device(self):
+        if self.wifi_device is None:
+            output = self.run_nmcli(["-t", "-f", "DEVICE,TYPE", "device", "status"], SCAN_TIMEOUT_SECS)
+            for line in output.splitlines():
+                parts = split_terse(line)
+                if len(parts) == 2 and parts[1] == "wifi":
+                    self.wifi_device = parts[0]
+                    break
+        return self.wifi_device
+
+    def wait_for_ip(self, timeout=IP_WAIT_SECS):
+        """Poll with a short, growing backoff until DHCP hands out an address."""
+        try:
+            device = self.find_wifi_device()
+            if not device:
+                return None
+            deadline = time.monotonic() + timeout
+            delay = 0.05
+            while True:
+                output = self.run_nmcli(["-g", "IP4.ADDRESS", "device", "show", device], SCAN_TIMEOUT_SECS)
+                address = output.strip().split("|")[0].strip()
+                if address:
+                    return address
+                if time.monotonic() + delay > deadline:
+                    return None
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+        except Exception as e:
+            log(f"Could not read IP address: {e}")
+            return None
+
+
+class FakeBackend(NetworkBackend):
+    """
+    Simulated networks: `count` access points (some sharing an SSID, like one
+    network on several APs/bands), a scan takes `latency` seconds and a
+    connect `connect_latency`. Any password of 8+ characters is accepted.
+    """
+    name = "fake"
+
+    def __init__(self, count=200, latency=1.0, connect_latency=1.0, seed=1234):
+        self.latency = latency
+        self.connect_latency = connect_latency
+        # A saved profile skips the association handshake
+        self.activate_latency = connect_latency / 3
+        self.dhcp_latency = 0.3
+        self.rng = random.Random(seed)
+        prefixes = ["NETGEAR", "xfinitywifi", "TP-Link_", "Linksys", "ATT", "DIRECT-", "Apt ", "Guest"]
+        # (bssid, ssid, base signal, security, channel)
+        self.access_points = []
+        ssids = []
+        for i in range(count):
+            if ssids and self.rng.random() < 0.2:
+                ssid = self.rng.choice(ssids)
+            else:
+                ssid = f"{self.rng.choice(prefixes)}{i:03d}"
+                ssids.append(ssid)
+            bssid = ":".join(f"{self.rng.randrange(256):02X}" for _ in range(6))
+            security = self.rng.choice(["WPA2", "WPA1 WPA2", "WPA3", ""])
+            channel = self.rng.choice([1, 6, 11, 36, 44, 149])
+            self.access_points.append((bssid, ssid, self.rng.randrange(10, 95), security, channel))
+        self.connected = None
+        self.known = set()
+        self.visible = []
+
+    def cached_scan(self):
+        networks = {}
+        for bssid, ssid, signal, security, channel in self.visible:
+            net = networks.get(ssid)
+            if net is None:
+                net = networks[ssid] = WifiNetwork(ssid, security)
+            net.add_bssid(bssid, signal, channel)
+            net.in_use = (ssid == self.connected)
+        return list(networks.values()), self.connected
+
+    def scan(self):
+        time.sleep(self.latency)
+        # Each scan sees most access points, with the signal wandering a bit
+        self.visible = [
+            (bssid, ssid, max(0, min(100, signal + self.rng.randrange(-8, 9))), security, channel)
+            for bssid, ssid, signal, security, channel in self.access_points
+            if self.rng.random() < 0.9
+        ]
+        self.rng.shuffle(self.visible)
+        return self.cached_scan()
+
+    def known_ssids(self):
+        return set(self.known)
+
+    def connect(self, ssid, password):
+        time.sleep(self.connect_latency)
+        if len(password or "") < 8:
+            return False, "nmcli failed (RC=4): Secrets were required, but not provided."
+        self.connected = ssid
+        self.known.add(ssid)
+        return True, ssid
+
+    def activate(self, ssid):
+        time.sleep(self.activate_latency)
+        if ssid not in self.known:
+            return False, f"Error: unknown connection '{ssid}'."
+        self.connected = ssid
+        return True, ssid
+
+    def wait_for_ip(self, timeout=IP_WAIT_SECS):
+        if self.connected is None:
+            return None
+        time.sleep(min(self.dhcp_latency, timeout))
+        return "192.168.1.23/24"
+
+
+class ScanScheduler:
+    """
+    Single-flight scans for one backend. request() never blocks: it marks a
+    scan as wanted and the one worker thread runs it once the previous scan
+    is at least SCAN_MIN_INTERVAL_SECS old. Requests made while a scan is
+    running or waiting out the interval are coalesced into one queued scan.
+
+    Progress goes to the listener (a callable, normally posting to the
+    event bus) of the latest request as
+      ("scan_started", None)
+      ("networks_cached", (networks, known, saved_at))   last run's list from disk, stale
+      ("networks", (networks, connected, known))   NM's cached list, before the first scan
+      ("scan_done", (networks, connected, known))
+      ("scan_failed", message)
+    cancel() drops a queued scan and anything the running one would still
+    publish. Every completed scan is written to the scan cache. Results are
+    snapshots: a tuple of WifiNetwork that nothing modifies afterwards and a
+    frozenset of known SSIDs.
+    """
+
+    def __init__(self, backend, min_interval=SCAN_MIN_INTERVAL_SECS,
+                 cache_path=WIFI_SCAN_CACHE_FILE, cache_ttl=WIFI_SCAN_CACHE_TTL_SECS):
+        self.backend = backend
+        self.min_interval = min_interval
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.cache_entries = []  # entries last written to (or read from) the cache
+        self.cond = threading.Condition()
+        self.thread = None
+        self.listener = None
+        self.pending = False
+        self.running = False
+        self.generation = 0
+        self.last_scan = None  # monotonic time the last scan finished
+        self.result = None     # (networks, connected, known, wall time), replaced as a whole
+        self.scans = 0
+        self.coalesced = 0
+
+    def request(self, listener):
+        with self.cond:
+            self.listener = listener
+            if self.pending:
+                self.coalesced += 1
+            self.pending = True
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="wifi-scan", daemon=True)
+                self.thread.start()
+            self.cond.notify()
+
+    def cancel(self):
+        with self.cond:
+            self.pending = False
+            self.listener = None
+            self.generation += 1
+
+    def is_busy(self):
+        return self.pending or self.running
+
+    def next_scan_delay(self):
+        if self.last_scan is None:
+            return 0
+        return self.last_scan + self.min_interval - time.monotonic()
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.pending or self.next_scan_delay() > 0:
+                    self.cond.wait(self.next_scan_delay() if self.pending else None)
+                self.pending = False
+                self.running = True
+                generation = self.generation
+                listener = self.listener
+
+            try:
+                self.scan(generation, listener)
+            finally:
+                with self.cond:
+                    self.running = False
+                    self.last_scan = time.monotonic()
+
+    def scan(self, generation, listener):
+        self.publish(generation, listener, ("scan_started", None))
+        if self.result is None and self.cache_path:
+            cached = read_scan_cache(self.cache_path, self.cache_ttl)
+            if cached:
+                self.cache_entries, known, saved = cached
+                networks = tuple(networks_from_cache(self.cache_entries))
+                self.publish(generation, listener, ("networks_cached", (networks, frozenset(known), saved)))
+        try:
+            # Show what NetworkManager already knows while the scan runs
+            known = frozenset(self.backend.known_ssids())
+            if self.result is None:
+                networks, connected = self.backend.cached_scan()
+                if networks:
+                    self.publish(generation, listener, ("networks", (tuple(networks), connected, known)))
+            networks, connected = self.backend.scan()
+            networks = tuple(networks)
+        except Exception as ex:
+            log(f"Wi-Fi scan failed: {ex}")
+            self.publish(generation, listener, ("scan_failed", f"Scan failed: {ex}"))
+            return
+        self.scans += 1
+        self.result = (networks, connected, known, time.time())
+        self.publish(generation, listener, ("scan_done", (networks, connected, known)))
+        if self.cache_path:
+            self.cache_entries = save_scan_cache(
+                self.cache_path, networks, known, self.cache_entries, self.cache_ttl
+            )
+
+    def publish(self, generation, listener, message):
+        with self.cond:
+            if listener is None or generation != self.generation:
+                return
+        listener(message)
+
+
+def make_backend(spec=None):
+    """Backend named by WIZARD_NETWORK_BACKEND (default nmcli)."""
+    spec = spec if spec is not None else os.environ.get(NETWORK_BACKEND_ENV, "nmcli")
+    name, *args = spec.split(":")
+    if name == "fake":
+        try:
+            count = int(args[0]) if len(args) > 0 else 200
+            latency = float(args[1]) if len(args) > 1 else 1.0
+        except ValueError:
+            log(f"Bad {NETWORK_BACKEND_ENV} value {spec!r}, using fake defaults")
+            count, latency = 200, 1.0
+        log(f"Using fake network backend ({count} networks, {latency}s scans)")
+        return FakeBackend(count, latency)
+    return NmcliBackend()
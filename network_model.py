@@ -0,0 +1,198 @@
+"""
+Scan results as the Wi-Fi screen wants them: one entry per SSID however
+many access points/bands broadcast it, ranked by signal with the connected
+and saved networks pinned on top, and merged into the list already on
+screen instead of replacing it. The last scan is also kept on disk so the
+next launch has a list to show before its first scan finishes.
+"""
+import os
+import json
+import time
+
+from .utils import log
+
+SCAN_CACHE_VERSION = 1
+
+# Fields requested from `nmcli -t device wifi list`, in this order
+NMCLI_FIELDS = ("IN-USE", "BSSID", "SSID", "SIGNAL", "SECURITY", "CHAN")
+
+
+def split_terse(line):
+    """Split an `nmcli -t` line on ':' while honouring its '\\:' escapes."""
+    fields = []
+    current = []
+    chars = iter(line)
+    for ch in chars:
+        if ch == "\\":
+            current.append(next(chars, ""))
+        elif ch == ":":
+            fields.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    fields.append("".join(current))
+    return fields
+
+
+class WifiNetwork:
+    """One SSID and every BSSID it was seen on: bssid -> (signal, channel)."""
+
+    def __init__(self, ssid, security=""):
+        self.ssid = ssid
+        self.security = security
+        self.bssids = {}
+        self.in_use = False
+
+    def add_bssid(self, bssid, signal, channel):
+        self.bssids[bssid] = (signal, channel)
+
+    @property
+    def signal(self):
+        return max((sig for sig, _ in self.bssids.values()), default=0)
+
+    @property
+    def channels(self):
+        return sorted({chan for _, chan in self.bssids.values()})
+
+    @property
+    def secured(self):
+        return bool(self.security) and self.security != "--"
+
+    def __repr__(self):
+        return f"WifiNetwork({self.ssid!r}, signal={self.signal}, bssids={len(self.bssids)})"
+
+
+def to_int(value, default=0):
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def parse_wifi_list(output):
+    """
+    Parse `nmcli -t -f IN-USE,BSSID,SSID,SIGNAL,SECURITY,CHAN device wifi list`.
+    Returns (networks grouped by SSID in first-seen order, connected SSID).
+    Hidden networks (empty SSID) are skipped.
+    """
+    networks = {}
+    connected = None
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        parts = split_terse(line)
+        if len(parts) != len(NMCLI_FIELDS):
+            continue
+        in_use, bssid, ssid, signal, security, chan = (p.strip() for p in parts)
+        if not ssid:
+            continue
+        net = networks.get(ssid)
+        if net is None:
+            net = networks[ssid] = WifiNetwork(ssid, security)
+        net.add_bssid(bssid, to_int(signal), to_int(chan))
+        if in_use == "*":
+            net.in_use = True
+            connected = ssid
+    return list(networks.values()), connected
+
+
+def rank_key(net, connected, known):
+    if net.ssid == connected:
+        group = 0
+    elif net.ssid in known:
+        group = 1
+    else:
+        group = 2
+    return (group, -net.signal, net.ssid.casefold())
+
+
+def rank_networks(networks, connected=None, known=()):
+    """Connected first, then saved networks, then everything else; strongest first within each."""
+    return sorted(networks, key=lambda n: rank_key(n, connected, known))
+
+
+def merge_networks(current, networks, connected=None, known=()):
+    """
+    New on-screen order (a list of SSIDs) after a scan. The pinned block
+    (connected, then saved networks) is re-ranked; everything else keeps
+    its place, networks that disappeared drop out and new ones are added
+    after the rest, strongest first. That way a rescan doesn't reshuffle
+    the rows under the cursor.
+    """
+    ranked = rank_networks(networks, connected, known)
+    if not current:
+        return [n.ssid for n in ranked]
+
+    present = {n.ssid for n in networks}
+    pinned = [n.ssid for n in ranked if n.ssid == connected or n.ssid in known]
+    pinned_set = set(pinned)
+    kept = [ssid for ssid in current if ssid in present and ssid not in pinned_set]
+    seen = pinned_set.union(kept)
+    added = [n.ssid for n in ranked if n.ssid not in seen]
+    return pinned + kept + added
+
+
+def read_scan_cache(path, ttl, now=None):
+    """
+    (entries, known SSIDs, saved time) from the scan cache, leaving out
+    networks not seen for ttl seconds. None if there is nothing usable.
+    """
+    now = time.time() if now is None else now
+    try:
+        with open(path, "r") as f:
+            cached = json.load(f)
+        if cached.get("version") != SCAN_CACHE_VERSION:
+            return None
+        entries = [entry for entry in cached["networks"] if now - entry["seen"] <= ttl]
+        known = set(cached.get("known", []))
+        saved = cached["saved"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log(f"Failed to read scan cache {path}: {e}")
+        return None
+    if not entries:
+        return None
+    return entries, known, saved
+
+
+def networks_from_cache(entries):
+    networks = []
+    for entry in entries:
+        net = WifiNetwork(entry["ssid"], entry["security"])
+        for bssid, signal, channel in entry["bssids"]:
+            net.add_bssid(bssid, signal, channel)
+        networks.append(net)
+    return networks
+
+
+def save_scan_cache(path, networks, known, previous=(), ttl=None, now=None):
+    """
+    Write a scan to the cache and return its entries. Entries from
+    `previous` (an earlier read or save) for networks this scan missed are
+    kept until they are ttl seconds old.
+    """
+    now = time.time() if now is None else now
+    entries = [
+        {
+            "ssid": net.ssid,
+            "security": net.security,
+            "seen": now,
+            "bssids": [[bssid, signal, channel] for bssid, (signal, channel) in net.bssids.items()],
+        }
+        for net in networks
+    ]
+    present = {net.ssid for net in networks}
+    for entry in previous:
+        if entry["ssid"] not in present and ttl is not None and now - entry["seen"] <= ttl:
+            entries.append(entry)
+    data = {"version": SCAN_CACHE_VERSION, "saved": now, "known": sorted(known), "networks": entries}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        log(f"Failed to write scan cache {path}: {e}")
+    return entries
@@ -1,76 +1,480 @@
 import pygame
 import sys
+import time
 
-from .constants import PHYSICAL_WIDTH, PHYSICAL_HEIGHT
+from .constants import PHYSICAL_WIDTH, PHYSICAL_HEIGHT, BLUE
 from .utils import log
+from .assets import declared_images
+from .text_cache import render_text
+from .event_bus import event_bus
+from . import alloc_debug
+
+# Draw order for scene nodes; nodes on the same layer keep insertion order.
+LAYER_BACKGROUND = 0
+LAYER_CONTENT = 10
+LAYER_OVERLAY = 100
+
+# Past this many separate dirty rects we just push their union.
+MAX_DIRTY_RECTS = 16
+
+# Modals dim the frozen screen underneath like a black overlay of this alpha
+MODAL_DIM_ALPHA = 180
+
+# Click/hover sounds shared by every screen (see Screen.load_ui_sounds)
+UI_SOUNDS = ["select.ogg", "hover.ogg"]
+
+
+class SceneNode:
+    """
+    Base retained node. Subclasses implement draw(surface).
+    Moving a node, hiding it or changing its content marks the old and
+    new area dirty so the Scene only repaints what changed.
+    """
+
+    def __init__(self, rect, layer=LAYER_CONTENT):
+        self.scene = None
+        self.rect = pygame.Rect(rect)
+        self.layer = layer
+        self.visible = True
+
+    def invalidate(self):
+        if self.scene:
+            self.scene.mark_dirty(self.rect)
+
+    def set_rect(self, rect):
+        rect = pygame.Rect(rect)
+        if rect != self.rect:
+            self.invalidate()
+            self.rect = rect
+            self.invalidate()
+
+    def set_visible(self, visible):
+        if visible != self.visible:
+            self.visible = visible
+            self.invalidate()
+
+    def draw(self, surface):
+        pass
+
+
+class ImageNode(SceneNode):
+    def __init__(self, image, pos, layer=LAYER_CONTENT):
+        super().__init__(image.get_rect(topleft=pos), layer)
+        self.image = image
+
+    def set_image(self, image):
+        # Identity check on purpose: screens swap between preloaded surfaces
+        if image is not self.image:
+            self.image = image
+            self.invalidate()
+            self.set_rect(image.get_rect(topleft=self.rect.topleft))
+
+    def draw(self, surface):
+        surface.blit(self.image, self.rect)
+
+
+class TextNode(SceneNode):
+    """
+    A line of text that is only re-rendered when the text or colour changes.
+    Anchor keywords are passed to get_rect, e.g. center=(x, y).
+    """
+
+    def __init__(self, font, text, color, layer=LAYER_CONTENT, **anchor):
+        super().__init__((0, 0, 0, 0), layer)
+        self.font = font
+        self.color = color
+        self.anchor = anchor
+        self.text = None
+        self.image = None
+        self.set_text(text, color)
+
+    def set_text(self, text, color=None):
+        if color is None:
+            color = self.color
+        if text == self.text and color == self.color:
+            return
+        self.text = text
+        self.color = color
+        self.invalidate()
+        if text:
+            self.image = render_text(self.font, text, color)
+            self.set_rect(self.image.get_rect(**self.anchor))
+        else:
+            self.image = None
+            self.set_rect((0, 0, 0, 0))
+        self.invalidate()
+
+    def draw(self, surface):
+        if self.image:
+            surface.blit(self.image, self.rect)
+
+
+class DrawNode(SceneNode):
+    """
+    Escape hatch for immediate-mode drawing: draw_fn(surface) is called
+    whenever the node's area gets repainted. Feed it a state value with
+    set_state() each frame; the node is only invalidated when it differs.
+    """
+
+    def __init__(self, rect, draw_fn, layer=LAYER_CONTENT):
+        super().__init__(rect, layer)
+        self.draw_fn = draw_fn
+        self.state = None
+
+    def set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.invalidate()
+
+    def draw(self, surface):
+        self.draw_fn(surface)
+
+
+class Scene:
+    """
+    Layered collection of nodes for one screen. render() repaints only the
+    dirty regions and returns them for pygame.display.update(); an empty
+    list means nothing changed and the frame doesn't need presenting.
+    """
+
+    def __init__(self):
+        self.nodes = []
+        self.dirty = []
+        self.full_redraw = True
+
+    def add(self, node):
+        node.scene = self
+        self.nodes.append(node)
+        self.nodes.sort(key=lambda n: n.layer)
+        node.invalidate()
+        return node
+
+    def remove(self, node):
+        if node in self.nodes:
+            node.invalidate()
+            self.nodes.remove(node)
+            node.scene = None
+
+    def mark_dirty(self, rect):
+        if rect.width > 0 and rect.height > 0:
+            self.dirty.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """Force a full repaint on the next render (e.g. after a screen change)."""
+        self.full_redraw = True
+
+    def render(self, surface):
+        bounds = surface.get_rect()
+        if self.full_redraw:
+            rects = [bounds]
+        else:
+            rects = self.merge_dirty(bounds)
+        self.full_redraw = False
+        self.dirty = []
+
+        for r in rects:
+            surface.set_clip(r)
+            for node in self.nodes:
+                if node.visible and node.rect.colliderect(r):
+                    node.draw(surface)
+        surface.set_clip(None)
+        return rects
+
+    def merge_dirty(self, bounds):
+        rects = []
+        for r in self.dirty:
+            r = r.clip(bounds)
+            if not r.width or not r.height:
+                continue
+            i = r.collidelist(rects)
+            while i != -1:
+                r.union_ip(rects.pop(i))
+                i = r.collidelist(rects)
+            rects.append(r)
+        if len(rects) > MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
+
+
+class Modal:
+    """
+    A modal layer (OSK, show_message). Its scene starts with a pre-dimmed
+    snapshot of the screen underneath, taken once when it opens, so each
+    frame only repaints what the modal itself changes.
+    """
+
+    def __init__(self, snapshot):
+        self.scene = Scene()
+        self.scene.add(ImageNode(snapshot, (0, 0), LAYER_BACKGROUND))
+
 
 class Screen:
+    # Subclasses list every image as (filename, size) plus any sounds, so
+    # asset_pack.py can bake and check them without building the screen.
+    IMAGES = []
+    SOUNDS = []
+
     def __init__(self, app):
         self.app = app
         self.font = self.app.font_NES_24
 
+        # Everything taken from app.assets, handed back by release_assets()
+        self.held_assets = []
+        # (event type, handler) on the event bus, dropped with the assets
+        self.subscriptions = []
+
+        self.scene = Scene()
+        self.scene.add(ImageNode(self.app.background, (0, 0), LAYER_BACKGROUND))
+        self.scene.add(ImageNode(self.app.bubble_image, self.app.bubble_rect.topleft, LAYER_BACKGROUND))
+
+    def add_placeholder_nodes(self, placeholders):
+        for p in placeholders:
+            self.scene.add(ImageNode(p["img"], p["pos"]))
+
+    # -------------------------------------------------------------------------
+    # ASSETS (shared through app.assets)
+    # -------------------------------------------------------------------------
+    def load_image(self, filename, size=None, alpha=True):
+        img = self.app.assets.image(self.app.get_path("images", filename), size, alpha)
+        self.held_assets.append(img)
+        return img
+
+    def load_sound(self, filename, volume=None):
+        snd = self.app.assets.sound(self.app.get_path("sounds", filename), volume)
+        self.held_assets.append(snd)
+        return snd
+
+    def load_placeholder_images(self, configs, fallback_color=BLUE):
+        """
+        configs: [{"path": ..., "size": (w,h), "pos": (x,y)}, ...]
+        Missing images are replaced by a filled box of fallback_color
+        (RGBA colours get a per-pixel-alpha surface).
+        """
+        result = []
+        for cfg in configs:
+            try:
+                img = self.load_image(cfg["path"], cfg["size"])
+            except Exception as e:
+                log(f"Failed to load image {cfg['path']}: {e}")
+                flags = pygame.SRCALPHA if len(fallback_color) == 4 else 0
+                img = pygame.Surface(cfg["size"], flags)
+                img.fill(fallback_color)
+            result.append({"img": img, "pos": cfg["pos"]})
+        return result
+
+    def load_image_set(self, filenames, fallback_size, fallback_colors):
+        """e.g. the normal/hover/pressed images of one button, as a tuple."""
+        try:
+            return tuple(self.load_image(f) for f in filenames)
+        except Exception as e:
+            log(f"Failed to load images {', '.join(filenames)}: {e}")
+            result = []
+            for color in fallback_colors:
+                img = pygame.Surface(fallback_size)
+                img.fill(color)
+                result.append(img)
+            return tuple(result)
+
+    def load_ui_sounds(self):
+        """The click/hover pair every screen uses; (None, None) if unavailable."""
+        try:
+            click = self.load_sound(UI_SOUNDS[0], 0.5)
+            hover = self.load_sound(UI_SOUNDS[1], 0.1)
+            return click, hover
+        except Exception as e:
+            log(f"Failed to load {type(self).__name__} sounds: {e}")
+            return None, None
+
+    def on_enter(self):
+        """Called when this screen becomes the active one."""
+        pass
+
+    def on_leave(self):
+        """Called when another screen replaces this one."""
+        pass
+
+    def subscribe(self, event_type, handler):
+        """Have handler(message) called on the UI thread for bus messages of event_type."""
+        event_bus.subscribe(event_type, handler)
+        self.subscriptions.append((event_type, handler))
+
+    def unsubscribe(self, event_type, handler):
+        event_bus.unsubscribe(event_type, handler)
+        if (event_type, handler) in self.subscriptions:
+            self.subscriptions.remove((event_type, handler))
+
+    def release_assets(self):
+        for asset in self.held_assets:
+            self.app.assets.release(asset)
+        self.held_assets = []
+        for event_type, handler in self.subscriptions:
+            event_bus.unsubscribe(event_type, handler)
+        self.subscriptions = []
+
     def handle_events(self, events):
+        """
+        events have been through app.input: the pad and stick arrive as
+        arrow/Enter/Escape/Tab key events, so screens only handle keys and
+        the mouse.
+        """
         for e in events:
             if e.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-            # Joystick => synthetic key events
-            if self.app.joystick:
-                if e.type == pygame.JOYAXISMOTION:
-                    if e.axis == 0:
-                        if e.value < -0.5:
-                            self.handle_key_event(pygame.K_LEFT)
-                        elif e.value > 0.5:
-                            self.handle_key_event(pygame.K_RIGHT)
-                    elif e.axis == 1:
-                        if e.value < -0.5:
-                            self.handle_key_event(pygame.K_UP)
-                        elif e.value > 0.5:
-                            self.handle_key_event(pygame.K_DOWN)
-                elif e.type == pygame.JOYBUTTONDOWN:
-                    if e.button == 0:  # 'A' => Enter
-                        self.handle_key_event(pygame.K_RETURN)
-                    elif e.button == 1:  # 'B' => Escape
-                        self.handle_key_event(pygame.K_ESCAPE)
-                    elif e.button == 2:  # 'X' => Tab
-                        self.handle_key_event(pygame.K_TAB)
-
-    def handle_key_event(self, key):
-        event_down = pygame.event.Event(pygame.KEYDOWN, key=key)
-        pygame.event.post(event_down)
-        event_up = pygame.event.Event(pygame.KEYUP, key=key)
-        pygame.event.post(event_up)
 
     def update(self):
         pass
 
     def render(self, surface):
-        pass
-
-    def render_background_and_bubble(self, surface):
-        surface.blit(self.app.background, (0, 0))
-        surface.blit(self.app.bubble_image, self.app.bubble_rect)
+        """
+        Screens update their nodes here and then call super().render(),
+        which returns the list of rects that were repainted. While a modal
+        is open only its scene is drawn.
+        """
+        modal = self.app.screen_manager.modal
+        if modal:
+            return modal.scene.render(surface)
+        return self.scene.render(surface)
 
 
 class ScreenManager:
     def __init__(self, app):
         self.app = app
+        self.factories = {}
+        self.next_screens = {}
+        self.exclusive_screens = set()
         self.screens = {}
         self.active_screen = None
+        self.active_name = None
+
+        self.modal = None
+
+        # Build the likely next screen ahead of time while the app is idle
+        self.prebuild_enabled = True
+        self.pending_prebuild = None
+
+    def register_screen(self, name, factory, next_screen=None, exclusive=False):
+        """
+        Screens are built lazily: factory(app) runs the first time
+        change_screen() targets name. next_screen names the page that
+        usually follows, so it can be pre-built while this one is idle.
+        exclusive screens can't navigate back, so entering one unloads
+        every other built screen and releases its assets.
+        """
+        self.factories[name] = factory
+        if next_screen:
+            self.next_screens[name] = next_screen
+        if exclusive:
+            self.exclusive_screens.add(name)
 
-    def register_screen(self, name, screen_instance):
-        self.screens[name] = screen_instance
+    def get_screen(self, name):
+        screen = self.screens.get(name)
+        if screen is None and name in self.factories:
+            alloc_debug.expect()
+            start = time.perf_counter()
+            factory = self.factories[name]
+            self.preload_images(factory)
+            screen = factory(self.app)
+            self.screens[name] = screen
+            log(f"Built screen {name} in {(time.perf_counter() - start) * 1000:.0f} ms "
+                f"(assets: {self.app.assets.describe()})")
+        return screen
+
+    def preload_images(self, *owners):
+        """Decode the images the given classes declare, in parallel, as one batch."""
+        self.app.assets.preload([
+            (self.app.get_path("images", filename), size, alpha)
+            for owner in owners
+            for filename, size, alpha in declared_images(owner)
+        ])
+
+    def unload_screen(self, name):
+        screen = self.screens.pop(name, None)
+        if screen is not None:
+            screen.release_assets()
+            log(f"Unloaded screen {name}")
 
     def change_screen(self, name):
-        if name in self.screens:
+        if name in self.factories:
             log(f"Changing screen to: {name}")
-            self.active_screen = self.screens[name]
+            self.modal = None
+            entering = self.active_name != name
+            if self.active_screen and entering:
+                self.active_screen.on_leave()
+            self.active_screen = self.get_screen(name)
+            self.active_name = name
+            self.active_screen.scene.invalidate()
+            if entering:
+                self.active_screen.on_enter()
+
+            if name in self.exclusive_screens:
+                for other in list(self.screens):
+                    if other != name:
+                        self.unload_screen(other)
 
-            # CLEAR the event queue to avoid "double presses"
-            pygame.event.clear()
+            next_name = self.next_screens.get(name)
+            if self.prebuild_enabled and next_name not in self.screens:
+                self.pending_prebuild = next_name
+            else:
+                self.pending_prebuild = None
+
+            # A direction held across the change must not repeat into the new screen
+            self.app.input.flush()
         else:
             log(f"Attempted to change to invalid screen: {name}")
 
+    def prebuild_next(self):
+        """
+        Called by the main loop on idle frames. Screens are built on the main
+        thread because pygame fonts and surfaces aren't safe to share with
+        a worker thread while we render.
+        """
+        name = self.pending_prebuild
+        if name:
+            self.pending_prebuild = None
+            log(f"Pre-building screen: {name}")
+            self.get_screen(name)
+
+    def open_modal(self, dim_alpha=MODAL_DIM_ALPHA):
+        """
+        Freeze the active screen into the cached snapshot surface, dim it
+        once and return a Modal whose scene the caller adds its nodes to.
+        """
+        alloc_debug.expect()
+        snapshot = self.app.assets.scratch(self.app.display_surf.get_size())
+
+        if self.active_screen:
+            scene = self.active_screen.scene
+            scene.invalidate()
+            scene.render(snapshot)
+        keep = 255 - dim_alpha
+        snapshot.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+
+        self.modal = Modal(snapshot)
+        return self.modal
+
+    def close_modal(self):
+        self.modal = None
+        self.invalidate()
+
+    def current_scene(self):
+        if self.modal:
+            return self.modal.scene
+        if self.active_screen:
+            return self.active_screen.scene
+        return None
+
+    def invalidate(self):
+        scene = self.current_scene()
+        if scene:
+            scene.invalidate()
+
+    def mark_dirty(self, rect):
+        """Have the visible scene repaint rect, e.g. under a debug overlay."""
+        scene = self.current_scene()
+        if scene:
+            scene.mark_dirty(rect)
+
     def handle_events(self, events):
         if self.active_screen:
             self.active_screen.handle_events(events)
@@ -81,4 +485,5 @@ class ScreenManager:
 
     def render(self, surface):
         if self.active_screen:
-            self.active_screen.render(surface)
\ No newline at end of file
+            return self.active_screen.render(surface)
+        return []
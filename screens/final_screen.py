@@ -2,11 +2,17 @@ import pygame
 import time
 import sys
 
-from ..screen_manager import Screen
+from ..screen_manager import Screen, TextNode
 from ..constants import PHYSICAL_WIDTH, PHYSICAL_HEIGHT
 from ..utils import log
 
 class FinalScreen(Screen):
+    IMAGES = [
+        ("setup_complete.png", (500,165)),
+        ("navigation_legend.png", (896,56)),
+        ("page_indicator_final.png", (212,18)),
+    ]
+
     def __init__(self, app):
         super().__init__(app)
         self.placeholder_images = self.define_placeholder_images()
@@ -15,6 +21,12 @@ class FinalScreen(Screen):
         self.start_time=None
         self.done_action=False
 
+        self.add_placeholder_nodes(self.placeholder_images)
+        y = self.app.bubble_rect.centery
+        for line in self.final_message.split("\n"):
+            self.scene.add(TextNode(self.font, line, (0,200,0), center=(PHYSICAL_WIDTH//2, y)))
+            y+=60
+
     def define_placeholder_images(self):
         configs = [
             {
@@ -42,23 +54,12 @@ class FinalScreen(Screen):
                 ),
             },
         ]
-        result=[]
-        for cfg in configs:
-            try:
-                ip = self.app.get_path("images", cfg["path"])
-                img = pygame.image.load(ip).convert_alpha()
-                img = pygame.transform.scale(img, cfg["size"])
-            except Exception as e:
-                log(f"Failed to load image {cfg['path']}: {e}")
-                img = pygame.Surface(cfg["size"])
-                img.fill((0,0,255))
-            result.append({"img": img, "pos": cfg["pos"]})
-        return result
+        return self.load_placeholder_images(configs)
 
     def handle_events(self, events):
         super().handle_events(events)
         for e in events:
-            if e.type in [pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.JOYBUTTONDOWN]:
+            if e.type in [pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN]:
                 self.finalize()
 
     def update(self):
@@ -86,16 +87,3 @@ class FinalScreen(Screen):
         self.app.remove_wizard_from_autostart()
         self.app.create_setup_flag()
         self.app.reboot_system()
-
-    def render(self, surf):
-        self.render_background_and_bubble(surf)
-        for ph in self.placeholder_images:
-            surf.blit(ph["img"], ph["pos"])
-
-        lines = self.final_message.split("\n")
-        y = self.app.bubble_rect.centery
-        for line in lines:
-            txt = self.font.render(line,True,(0,200,0))
-            rect = txt.get_rect(center=(PHYSICAL_WIDTH//2, y))
-            surf.blit(txt, rect)
-            y+=60
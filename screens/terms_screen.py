@@ -1,18 +1,31 @@
 import pygame
 import datetime
+import hashlib
 import sys
 
-from ..screen_manager import Screen
-from ..constants import BLACK, BLUE, GRAY, RED, GREEN, YELLOW, TERMS_LOG_FILE
+from ..screen_manager import Screen, UI_SOUNDS, ImageNode, DrawNode
+from ..constants import BLACK, BLUE, GRAY, RED, GREEN, YELLOW, TERMS_LOG_FILE, TERMS_LAYOUT_CACHE_FILE
 from ..utils import log, show_message
+from ..widgets.tiled_text import TiledText, wrap_lines, cached_wrap_lines
 
 class TermsScreen(Screen):
+    IMAGES = [
+        ("user_agreement.png", (803,205)),
+        ("navigation_legend.png", (896,56)),
+        ("page_indicator_3.png", (212,18)),
+        ("agree_normal_lg.png", None),
+        ("agree_hover_lg.png", None),
+        ("agree_pressed_lg.png", None),
+    ]
+    SOUNDS = UI_SOUNDS
+
     def __init__(self, app):
         super().__init__(app)
         self.font = self.app.font_NES_20
 
+        self.terms_hash = None
         self.terms_lines = self.load_terms()
-        self.terms_surface = None
+        self.terms_text = None
 
         self.scroll_offset = 0
         self.scroll_speed = 20
@@ -35,8 +48,15 @@ class TermsScreen(Screen):
 
         self.placeholder_images = self.load_placeholders()
         self.agree_normal, self.agree_hover, self.agree_pressed = self.load_agree_imgs()
+        # Greyed-out variant shown until the user scrolls to the bottom
+        self.agree_disabled = self.agree_normal.copy()
+        self.agree_disabled.set_alpha(100)
+
+        self.layout_terms()
 
-        self.render_terms_surface()
+        self.add_placeholder_nodes(self.placeholder_images)
+        self.text_box_node = self.scene.add(DrawNode(self.text_box_rect, self.draw_text_box))
+        self.agree_node = self.scene.add(ImageNode(self.agree_disabled, self.agree_button_rect.topleft))
 
         self.click_sound = None
         self.hover_sound = None
@@ -47,9 +67,10 @@ class TermsScreen(Screen):
         try:
             path = self.app.get_path("terms_and_conditions.txt")
             with open(path, "r") as f:
-                raw = f.readlines()
-            for rl in raw:
-                lines.append(rl.rstrip("\n"))
+                text = f.read()
+            self.terms_hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+            for rl in text.splitlines():
+                lines.append(rl)
         except FileNotFoundError:
             log("Error: terms_and_conditions.txt not found.")
             lines = ["**Error: Terms and Conditions file not found.**"]
@@ -82,76 +103,32 @@ class TermsScreen(Screen):
                 ),
             },
         ]
-        result = []
-        for cfg in configs:
-            try:
-                ip = self.app.get_path("images", cfg["path"])
-                img = pygame.image.load(ip).convert_alpha()
-                img = pygame.transform.scale(img, cfg["size"])
-            except Exception as e:
-                log(f"Failed to load image {cfg['path']}: {e}")
-                img = pygame.Surface(cfg["size"])
-                img.fill(BLUE)
-            result.append({"img": img, "pos": cfg["pos"]})
-        return result
+        return self.load_placeholder_images(configs)
 
     def load_agree_imgs(self):
-        try:
-            n = pygame.image.load(self.app.get_path("images","agree_normal_lg.png")).convert_alpha()
-            h = pygame.image.load(self.app.get_path("images","agree_hover_lg.png")).convert_alpha()
-            p = pygame.image.load(self.app.get_path("images","agree_pressed_lg.png")).convert_alpha()
-        except Exception as e:
-            log(f"Failed to load agree button images: {e}")
-            n = pygame.Surface((222,55))
-            n.fill(GREEN)
-            h = pygame.Surface((222,55))
-            h.fill(YELLOW)
-            p = pygame.Surface((222,55))
-            p.fill(RED)
-        return n,h,p
+        return self.load_image_set(
+            ["agree_normal_lg.png", "agree_hover_lg.png", "agree_pressed_lg.png"],
+            (222,55), [GREEN, YELLOW, RED]
+        )
 
     def load_sounds(self):
-        try:
-            cpath = self.app.get_path("sounds","select.ogg")
-            hpath = self.app.get_path("sounds","hover.ogg")
-            self.click_sound = pygame.mixer.Sound(cpath)
-            self.click_sound.set_volume(0.5)
-            self.hover_sound = pygame.mixer.Sound(hpath)
-            self.hover_sound.set_volume(0.1)
-        except Exception as e:
-            log(f"Failed to load TermsScreen sounds: {e}")
+        self.click_sound, self.hover_sound = self.load_ui_sounds()
 
-    def render_terms_surface(self):
+    def layout_terms(self):
         max_width = self.text_box_rect.width - 20
-        rendered_lines = []
-        for line in self.terms_lines:
-            if not line.strip():
-                # blank line
-                rendered_lines.append("")
-            else:
-                words = line.split(" ")
-                current_line = ""
-                for w in words:
-                    test_line = (current_line + " " + w).strip()
-                    surf_test = self.font.render(test_line, True, BLACK)
-                    if surf_test.get_width() > max_width:
-                        rendered_lines.append(current_line)
-                        current_line = w
-                    else:
-                        current_line = test_line
-                rendered_lines.append(current_line)
-
-        line_height = self.font.get_linesize()
-        total_height = line_height * len(rendered_lines)
-
-        self.terms_surface = pygame.Surface((max_width,total_height), pygame.SRCALPHA)
-        self.terms_surface.fill((0,0,0,0))
-
-        y = 0
-        for rl in rendered_lines:
-            txt = self.font.render(rl,True,BLACK)
-            self.terms_surface.blit(txt,(0,y))
-            y += line_height
+        # Only cache when we know exactly which font file and size this is
+        font_key = self.app.assets.key_for(self.font)
+        if self.terms_hash and font_key:
+            _, font_path, font_size = font_key
+            wrapped = cached_wrap_lines(
+                self.font, self.terms_lines, max_width, TERMS_LAYOUT_CACHE_FILE,
+                {"text_sha1": self.terms_hash, "font": font_path, "font_size": font_size,
+                 "pygame": pygame.version.ver},
+            )
+        else:
+            wrapped = wrap_lines(self.font, self.terms_lines, max_width)
+        self.terms_text = TiledText(self.font, wrapped, max_width, BLACK,
+                                    viewport_height=self.text_box_rect.height)
 
     def handle_events(self, events):
         super().handle_events(events)
@@ -173,24 +150,8 @@ class TermsScreen(Screen):
                 elif e.key == pygame.K_RIGHT:
                     if self.agree_enabled:
                         self.agree_selected = True
-            elif e.type == pygame.JOYBUTTONDOWN:
-                if e.button == 0:
-                    if self.agree_enabled and self.agree_selected:
-                        self.on_agree()
-                elif e.button == 1:
+                elif e.key == pygame.K_ESCAPE:
                     self.app.screen_manager.change_screen("timezone")
-            elif e.type == pygame.JOYAXISMOTION:
-                if e.axis == 1:
-                    if e.value > 0.5:
-                        self.scroll_offset -= self.scroll_speed
-                    elif e.value < -0.5:
-                        self.scroll_offset += self.scroll_speed
-                elif e.axis == 0:
-                    if e.value < -0.5:
-                        self.agree_selected = False
-                    elif e.value > 0.5:
-                        if self.agree_enabled:
-                            self.agree_selected = True
 
         self.clamp_scroll()
 
@@ -211,7 +172,7 @@ class TermsScreen(Screen):
             log(f"Failed to write to terms log: {e}")
 
     def clamp_scroll(self):
-        total_h = self.terms_surface.get_height()
+        total_h = self.terms_text.height
         visible_h = self.text_box_rect.height
         min_offset = -(total_h - visible_h)
         if min_offset>0:
@@ -228,22 +189,7 @@ class TermsScreen(Screen):
             self.agree_selected = False
 
     def render(self, surf):
-        self.render_background_and_bubble(surf)
-        for p in self.placeholder_images:
-            surf.blit(p["img"], p["pos"])
-
-        old_clip = surf.get_clip()
-        surf.set_clip(self.text_box_rect)
-
-        area_y = -self.scroll_offset
-        if area_y<0:
-            area_y=0
-        area = pygame.Rect(0, area_y, self.text_box_rect.width, self.text_box_rect.height)
-
-        surf.blit(self.terms_surface,(self.text_box_rect.left,self.text_box_rect.top),area=area)
-        surf.set_clip(old_clip)
-
-        self.draw_scrollbar(surf)
+        self.text_box_node.set_state(self.scroll_offset)
 
         mx,my = pygame.mouse.get_pos()
         if self.agree_enabled:
@@ -257,10 +203,18 @@ class TermsScreen(Screen):
             else:
                 current = self.agree_normal
         else:
-            current = self.agree_normal.copy()
-            current.set_alpha(100)
+            current = self.agree_disabled
+
+        self.agree_node.set_image(current)
+        return super().render(surf)
 
-        surf.blit(current, self.agree_button_rect)
+    def draw_text_box(self, surf):
+        area_y = -self.scroll_offset
+        if area_y<0:
+            area_y=0
+        self.terms_text.draw(surf, self.text_box_rect, area_y)
+
+        self.draw_scrollbar(surf)
 
     def draw_scrollbar(self, surf):
         bar_w=20
@@ -269,7 +223,7 @@ class TermsScreen(Screen):
         bar_h=self.text_box_rect.height
         pygame.draw.rect(surf,GRAY,(bar_x,bar_y,bar_w,bar_h))
 
-        total_h=self.terms_surface.get_height()
+        total_h=self.terms_text.height
         if total_h<=bar_h:
             return
 
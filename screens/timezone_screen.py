@@ -3,11 +3,24 @@ import subprocess
 import sys
 import time
 
-from ..screen_manager import Screen
+from ..screen_manager import Screen, UI_SOUNDS, ImageNode
 from ..constants import GREEN, RED, BLUE
 from ..utils import log, show_message
 
 class EnterTimezoneScreen(Screen):
+    IMAGES = [
+        ("choose_timezone.png", (822,239)),
+        ("navigation_legend.png", (896,56)),
+        ("page_indicator_2.png", (212,18)),
+    ] + [
+        (f"map_{zone}.png", (272,150)) for zone in ("western", "mountain", "central", "eastern")
+    ] + [
+        (f"{zone}_{state}_lg.png", None)
+        for zone in ("western", "mountain", "central", "eastern")
+        for state in ("normal", "hover")
+    ]
+    SOUNDS = UI_SOUNDS
+
     def __init__(self, app):
         super().__init__(app)
         self.zones = self.build_zones()
@@ -21,19 +34,14 @@ class EnterTimezoneScreen(Screen):
 
         self.placeholder_images = []
         self.define_placeholder_images()
+        self.add_placeholder_nodes(self.placeholder_images)
+
+        for zone in self.zones:
+            self.scene.add(ImageNode(zone["map_surf"], (zone["map_x"], zone["map_y"])))
+            zone["btn_node"] = self.scene.add(ImageNode(zone["btn_norm"], zone["btn_rect"].topleft))
 
     def load_sounds(self):
-        try:
-            click_path = self.app.get_path("sounds","select.ogg")
-            hover_path = self.app.get_path("sounds","hover.ogg")
-            self.click_sound = pygame.mixer.Sound(click_path)
-            self.click_sound.set_volume(0.5)
-            self.hover_sound = pygame.mixer.Sound(hover_path)
-            self.hover_sound.set_volume(0.1)
-        except Exception as e:
-            log(f"Failed to load EnterTimezoneScreen sounds: {e}")
-            self.click_sound = None
-            self.hover_sound = None
+        self.click_sound, self.hover_sound = self.load_ui_sounds()
 
     def define_placeholder_images(self):
         configs = [
@@ -62,16 +70,7 @@ class EnterTimezoneScreen(Screen):
                 ),
             },
         ]
-        for cfg in configs:
-            try:
-                ip = self.app.get_path("images", cfg["path"])
-                img = pygame.image.load(ip).convert_alpha()
-                img = pygame.transform.scale(img, cfg["size"])
-            except Exception as e:
-                log(f"Failed to load image {cfg['path']}: {e}")
-                img = pygame.Surface(cfg["size"])
-                img.fill(BLUE)
-            self.placeholder_images.append({"img": img, "pos": cfg["pos"]})
+        self.placeholder_images.extend(self.load_placeholder_images(configs))
 
     def build_zones(self):
         data = [
@@ -115,9 +114,7 @@ class EnterTimezoneScreen(Screen):
         zones = []
         for i,d in enumerate(data):
             try:
-                mp = self.app.get_path("images", d["map_img"])
-                map_surf = pygame.image.load(mp).convert_alpha()
-                map_surf = pygame.transform.scale(map_surf, d["map_size"])
+                map_surf = self.load_image(d["map_img"], d["map_size"])
             except Exception as e:
                 log(f"Failed to load map image {d['map_img']}: {e}")
                 map_surf = pygame.Surface(d["map_size"])
@@ -126,17 +123,9 @@ class EnterTimezoneScreen(Screen):
             ax_map = self.app.bubble_rect.left + map_x_positions[i]
             ay_map = self.app.bubble_rect.top + map_y
 
-            try:
-                bn_path = self.app.get_path("images", d["btn_norm"])
-                bn = pygame.image.load(bn_path).convert_alpha()
-                bh_path = self.app.get_path("images", d["btn_hov"])
-                bh = pygame.image.load(bh_path).convert_alpha()
-            except Exception as e:
-                log(f"Failed to load button images for {d['name']}: {e}")
-                bn = pygame.Surface((222,55))
-                bn.fill((100,200,100))
-                bh = pygame.Surface((222,55))
-                bh.fill((200,100,200))
+            bn, bh = self.load_image_set(
+                [d["btn_norm"], d["btn_hov"]], (222,55), [(100,200,100), (200,100,200)]
+            )
 
             btn_w = bn.get_width()
             btn_h = bn.get_height()
@@ -176,11 +165,6 @@ class EnterTimezoneScreen(Screen):
                     zone = self.zones[self.selected_zone_index]
                     self.set_timezone(zone["tz"])
 
-            elif e.type == pygame.JOYBUTTONDOWN:
-                if e.button == 0:
-                    zone = self.zones[self.selected_zone_index]
-                    self.set_timezone(zone["tz"])
-
     def move_selection(self, direction):
         if self.zones:
             self.zones[self.selected_zone_index]["hovered"] = False
@@ -194,21 +178,17 @@ class EnterTimezoneScreen(Screen):
         try:
             subprocess.run(["sudo","timedatectl","set-timezone",timezone], check=True)
             log(f"Timezone set to {timezone}")
-            show_message(self.app.display_surf,f"Timezone set to {timezone}", color=GREEN, timeout=2)
+            show_message(self.app.screen_manager, f"Timezone set to {timezone}", color=GREEN, timeout=2)
             pygame.time.wait(1000)
             self.app.screen_manager.change_screen("terms")
         except subprocess.CalledProcessError as e:
             log(f"Error setting timezone: {e}")
-            show_message(self.app.display_surf, f"Error: {e}", color=RED, timeout=3)
+            show_message(self.app.screen_manager, f"Error: {e}", color=RED, timeout=3)
 
     def render(self, surf):
-        self.render_background_and_bubble(surf)
-        for ph in self.placeholder_images:
-            surf.blit(ph["img"], ph["pos"])
-
         mx,my = pygame.mouse.get_pos()
         for idx, zone in enumerate(self.zones):
-            surf.blit(zone["map_surf"], (zone["map_x"],zone["map_y"]))
             hovered = zone["btn_rect"].collidepoint(mx,my) or zone["hovered"]
             current = zone["btn_hov"] if hovered else zone["btn_norm"]
-            surf.blit(current, (zone["btn_rect"].x, zone["btn_rect"].y))
\ No newline at end of file
+            zone["btn_node"].set_image(current)
+        return super().render(surf)
\ No newline at end of file
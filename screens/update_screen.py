@@ -1,15 +1,24 @@
 import pygame
 import subprocess
 import threading
-import queue
 import time
 import sys
 
-from ..screen_manager import Screen
-from ..constants import WHITE, YELLOW, GREEN, RED, AUTO_UPDATE_SCRIPT, PHYSICAL_WIDTH
+from ..screen_manager import Screen, TextNode
+from ..constants import BLACK, WHITE, YELLOW, GREEN, RED, AUTO_UPDATE_SCRIPT, PHYSICAL_WIDTH
 from ..utils import log
+from ..event_bus import event_bus
+
+# ("info"|"line"|"done"|"error", content) from the update script worker
+UPDATE_EVENT = event_bus.register("update")
 
 class UpdateScreen(Screen):
+    IMAGES = [
+        ("update_screen.png", (683,165)),
+        ("navigation_legend.png", (896,56)),
+        ("page_indicator_5.png", (212,18)),
+    ]
+
     def __init__(self, app):
         super().__init__(app)
         self.font = self.app.font_NES_24
@@ -17,8 +26,14 @@ class UpdateScreen(Screen):
 
         self.status_message = "Checking for updates..."
         self.update_thread = None
-        self.message_queue = queue.Queue()
         self.update_complete = False
+        self.subscribe(UPDATE_EVENT, self.handle_message)
+
+        self.add_placeholder_nodes(self.placeholder_images)
+        self.status_node = self.scene.add(TextNode(
+            self.font, self.status_message, BLACK,
+            center=(PHYSICAL_WIDTH//2, self.app.bubble_rect.centery)
+        ))
 
         self.scan_updates()
 
@@ -49,72 +64,55 @@ class UpdateScreen(Screen):
                 ),
             },
         ]
-        result = []
-        for cfg in configs:
-            try:
-                ip = self.app.get_path("images", cfg["path"])
-                img = pygame.image.load(ip).convert_alpha()
-                img = pygame.transform.scale(img, cfg["size"])
-            except Exception as e:
-                log(f"Failed to load image {cfg['path']}: {e}")
-                img = pygame.Surface(cfg["size"])
-                img.fill((0,0,255))
-            result.append({"img": img, "pos": cfg["pos"]})
-        return result
+        return self.load_placeholder_images(configs)
 
     def handle_events(self, events):
         super().handle_events(events)
         if self.update_complete:
             for e in events:
-                if e.type in [pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.JOYBUTTONDOWN]:
+                if e.type in [pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN]:
                     self.finish_update_flow()
 
     def scan_updates(self):
         def worker():
-            self.message_queue.put(("info","Looking for updates..."))
+            event_bus.post(UPDATE_EVENT, ("info","Looking for updates..."))
             try:
                 proc = subprocess.Popen(["sudo", AUTO_UPDATE_SCRIPT],
                                         stdout=subprocess.PIPE,
                                         stderr=subprocess.STDOUT,
                                         text=True)
                 for line in proc.stdout:
-                    self.message_queue.put(("line", line.rstrip("\n")))
+                    event_bus.post(UPDATE_EVENT, ("line", line.rstrip("\n")))
                 proc.wait()
                 rc = proc.returncode
-                self.message_queue.put(("done", rc))
+                event_bus.post(UPDATE_EVENT, ("done", rc))
             except Exception as e:
-                self.message_queue.put(("error", str(e)))
+                event_bus.post(UPDATE_EVENT, ("error", str(e)))
 
         self.update_thread = threading.Thread(target=worker, daemon=True)
         self.update_thread.start()
 
-    def update(self):
-        while not self.message_queue.empty():
-            msg_type, content = self.message_queue.get()
-            if msg_type=="info":
-                self.status_message = content
-            elif msg_type=="line":
-                self.status_message = content
-                log(f"UpdateScript: {content}")
-            elif msg_type=="done":
-                rc = content
-                if rc==0:
-                    self.status_message="Updates applied successfully. Press designated SELECT button to continue."
-                else:
-                    self.status_message=f"Update script failed (RC={rc})."
-                self.update_complete=True
-            elif msg_type=="error":
-                self.status_message=f"Error: {content}"
-                self.update_complete=True
+    def handle_message(self, message):
+        msg_type, content = message
+        if msg_type=="info":
+            self.status_message = content
+        elif msg_type=="line":
+            self.status_message = content
+            log(f"UpdateScript: {content}")
+        elif msg_type=="done":
+            rc = content
+            if rc==0:
+                self.status_message="Updates applied successfully. Press designated SELECT button to continue."
+            else:
+                self.status_message=f"Update script failed (RC={rc})."
+            self.update_complete=True
+        elif msg_type=="error":
+            self.status_message=f"Error: {content}"
+            self.update_complete=True
 
     def finish_update_flow(self):
         self.app.screen_manager.change_screen("final")
 
     def render(self, surf):
-        self.render_background_and_bubble(surf)
-        for p in self.placeholder_images:
-            surf.blit(p["img"], p["pos"])
-
-        txt = self.font.render(self.status_message, True, BLACK)
-        rect = txt.get_rect(center=(PHYSICAL_WIDTH//2, self.app.bubble_rect.centery))
-        surf.blit(txt, rect)
\ No newline at end of file
+        self.status_node.set_text(self.status_message)
+        return super().render(surf)
\ No newline at end of file
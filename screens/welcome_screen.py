@@ -1,11 +1,22 @@
 import pygame
 import sys
 
-from ..screen_manager import Screen
+from ..screen_manager import Screen, UI_SOUNDS, ImageNode
 from ..constants import GREEN, YELLOW, RED, BLUE
 from ..utils import log
 
 class WelcomeScreen(Screen):
+    IMAGES = [
+        ("continue_normal_lg.png", None),
+        ("continue_hover_lg.png", None),
+        ("continue_pressed_lg.png", None),
+        ("welcome_arcade.png", (1058,324)),
+        ("get_started.png", (324,18)),
+        ("navigation_legend.png", (896,56)),
+        ("page_indicator_1.png", (212,18)),
+    ]
+    SOUNDS = UI_SOUNDS
+
     def __init__(self, app):
         super().__init__(app)
         self.next_button_rect = pygame.Rect(
@@ -21,37 +32,17 @@ class WelcomeScreen(Screen):
         self.load_sounds()
         self.placeholder_images = self.define_placeholder_images()
 
+        self.next_button_node = self.scene.add(ImageNode(self.next_normal, self.next_button_rect.topleft))
+        self.add_placeholder_nodes(self.placeholder_images)
+
     def load_buttons(self):
-        # Using get_path to find images inside arcade_wizard/images/
-        try:
-            n_path = self.app.get_path("images","continue_normal_lg.png")
-            h_path = self.app.get_path("images","continue_hover_lg.png")
-            p_path = self.app.get_path("images","continue_pressed_lg.png")
-            n = pygame.image.load(n_path).convert_alpha()
-            h = pygame.image.load(h_path).convert_alpha()
-            p = pygame.image.load(p_path).convert_alpha()
-        except Exception as e:
-            log(f"Failed to load WelcomeScreen buttons: {e}")
-            n = pygame.Surface((441,107))
-            n.fill(GREEN)
-            h = pygame.Surface((441,107))
-            h.fill(YELLOW)
-            p = pygame.Surface((441,107))
-            p.fill(RED)
-        self.next_normal, self.next_hover, self.next_pressed = n, h, p
+        self.next_normal, self.next_hover, self.next_pressed = self.load_image_set(
+            ["continue_normal_lg.png", "continue_hover_lg.png", "continue_pressed_lg.png"],
+            (441,107), [GREEN, YELLOW, RED]
+        )
 
     def load_sounds(self):
-        try:
-            click_path = self.app.get_path("sounds","select.ogg")
-            hover_path = self.app.get_path("sounds","hover.ogg")
-            self.button_click_sound = pygame.mixer.Sound(click_path)
-            self.button_click_sound.set_volume(0.5)
-            self.button_hover_sound = pygame.mixer.Sound(hover_path)
-            self.button_hover_sound.set_volume(0.1)
-        except Exception as e:
-            log(f"Failed to load WelcomeScreen sounds: {e}")
-            self.button_click_sound = None
-            self.button_hover_sound = None
+        self.button_click_sound, self.button_hover_sound = self.load_ui_sounds()
 
     def define_placeholder_images(self):
         configs = [
@@ -88,18 +79,7 @@ class WelcomeScreen(Screen):
                 ),
             }
         ]
-        result = []
-        for cfg in configs:
-            try:
-                img_path = self.app.get_path("images", cfg["path"])
-                img = pygame.image.load(img_path).convert_alpha()
-                img = pygame.transform.scale(img, cfg["size"])
-            except Exception as e:
-                log(f"Failed to load image {cfg['path']}: {e}")
-                img = pygame.Surface(cfg["size"])
-                img.fill(BLUE)
-            result.append({"img": img, "pos": cfg["pos"]})
-        return result
+        return self.load_placeholder_images(configs)
 
     def handle_events(self, events):
         super().handle_events(events)
@@ -115,22 +95,14 @@ class WelcomeScreen(Screen):
                     if self.button_click_sound:
                         self.button_click_sound.play()
                     self.app.screen_manager.change_screen("timezone")
-            elif e.type == pygame.JOYBUTTONDOWN:
-                if e.button == 0:
-                    if self.button_click_sound:
-                        self.button_click_sound.play()
-                    self.app.screen_manager.change_screen("timezone")
-            elif e.type == pygame.JOYAXISMOTION:
-                if e.axis == 1:
-                    if e.value < -0.5:
-                        self.next_button_selected = True
-                        if self.button_hover_sound:
-                            self.button_hover_sound.play()
-                    elif e.value > 0.5:
-                        self.next_button_selected = False
+                elif e.key == pygame.K_UP:
+                    self.next_button_selected = True
+                    if self.button_hover_sound:
+                        self.button_hover_sound.play()
+                elif e.key == pygame.K_DOWN:
+                    self.next_button_selected = False
 
     def render(self, surface):
-        self.render_background_and_bubble(surface)
         mx,my = pygame.mouse.get_pos()
 
         if self.next_button_rect.collidepoint(mx,my):
@@ -146,7 +118,5 @@ class WelcomeScreen(Screen):
         else:
             current = self.next_normal
 
-        surface.blit(current, self.next_button_rect)
-
-        for p in self.placeholder_images:
-            surface.blit(p["img"], p["pos"])
\ No newline at end of file
+        self.next_button_node.set_image(current)
+        return super().render(surface)
\ No newline at end of file
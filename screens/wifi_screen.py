@@ -1,19 +1,25 @@
 import os
 import sys
 import time
-import queue
 import threading
-import subprocess
 
 import pygame
 
-from ..screen_manager import Screen
+from ..screen_manager import Screen, UI_SOUNDS, ImageNode, TextNode, DrawNode, LAYER_OVERLAY
 from ..constants import BLACK, WHITE, YELLOW, GREEN, RED, PHYSICAL_WIDTH, PHYSICAL_HEIGHT
-from ..utils import log
+from ..utils import log, format_age
+from ..text_cache import render_text
 from ..widgets.onscreen_keyboard import OnScreenKeyboard
+from ..widgets.virtual_list import VirtualList
+from ..network_model import merge_networks
+from ..event_bus import event_bus
 
 GRAY = (200, 200, 200)
 LIGHT_GRAY = (220, 220, 220)
+STALE_GRAY = (120, 120, 120)
+
+# (type, content[, color]) from the connect worker and the scan scheduler
+WIFI_EVENT = event_bus.register("wifi")
 
 ###############################################################################
 # Toggle this to True/False if you want to enable/disable hover/click sounds
@@ -31,22 +37,35 @@ class WiFiScreen(Screen):
       - If nmcli fails, show exit code in status box
     """
 
+    IMAGES = [
+        ("connect_to_wifi.png", (500,165)),
+        ("navigation_legend.png", (896,56)),
+        ("page_indicator_4.png", (212,18)),
+    ] + [
+        (f"{base}_{state}_sm.png", None)
+        for base in ("rescan", "manual_ssid", "skip", "continue")
+        for state in ("normal", "hover", "pressed")
+    ]
+    SOUNDS = UI_SOUNDS
+
     def __init__(self, app):
         super().__init__(app)
 
         # Data for networks
-        self.networks = []
+        self.networks = []       # SSIDs in on-screen order
+        self.network_info = {}   # SSID -> WifiNetwork from the latest scan
+        self.known_ssids = set() # SSIDs with a saved NetworkManager profile
         self.connected_ssid = None
         self.selected_network_index = -1
+        self.list_stale = False  # showing the cached list from the last run
 
         # OSK
         self.osk_mode = None
         self.osk = None
         self.osk_prompt_text = ""  # e.g. "Enter your custom SSID name", "Enter password for X"
 
-        # Worker
+        # Worker results arrive through the event bus, while the screen is active
         self.connection_thread = None
-        self.message_queue = queue.Queue()
 
         # Status message
         self.status_message = None
@@ -59,10 +78,6 @@ class WiFiScreen(Screen):
         self.last_hover_time = 0
         self.hover_cooldown_ms = 300
 
-        # Wi-Fi scanning
-        self.scan_interval = 10
-        self.last_scan_time = 0
-
         # Buttons geometry
         self.button_width = 203
         self.button_height = 61
@@ -112,8 +127,7 @@ class WiFiScreen(Screen):
 
         self.user_just_clicked = False
 
-        # Start scanning
-        self.scan_wifi()
+        self.build_scene()
 
     # -------------------------------------------------------------------------
     # IMAGE LOADING
@@ -145,51 +159,47 @@ class WiFiScreen(Screen):
                 ),
             },
         ]
-        for cfg in configs:
-            try:
-                img_path = self.app.get_path("images", cfg["path"])
-                img = pygame.image.load(img_path).convert_alpha()
-                img = pygame.transform.scale(img, cfg["size"])
-            except Exception as e:
-                log(f"Failed to load WiFi placeholder {cfg['path']}: {e}")
-                img = pygame.Surface(cfg["size"], pygame.SRCALPHA)
-                img.fill((255,0,0,128))
-            self.placeholder_images.append({"img": img, "pos": cfg["pos"]})
+        self.placeholder_images.extend(self.load_placeholder_images(configs, (255,0,0,128)))
 
     def load_button_images(self, base_name):
         """
         e.g. "rescan_normal_sm.png", "rescan_hover_sm.png", "rescan_pressed_sm.png"
         """
-        try:
-            n = pygame.image.load(self.app.get_path("images", f"{base_name}_normal_sm.png")).convert_alpha()
-            h = pygame.image.load(self.app.get_path("images", f"{base_name}_hover_sm.png")).convert_alpha()
-            p = pygame.image.load(self.app.get_path("images", f"{base_name}_pressed_sm.png")).convert_alpha()
-        except Exception as e:
-            log(f"Failed to load {base_name} button images: {e}")
-            n = pygame.Surface((203,61))
-            n.fill((100,200,100))
-            h = pygame.Surface((203,61))
-            h.fill((200,100,200))
-            p = pygame.Surface((203,61))
-            p.fill((200,0,0))
-
-        return (n, h, p)
+        return self.load_image_set(
+            [f"{base_name}_normal_sm.png", f"{base_name}_hover_sm.png", f"{base_name}_pressed_sm.png"],
+            (203,61), [(100,200,100), (200,100,200), (200,0,0)]
+        )
+
+    def build_scene(self):
+        self.add_placeholder_nodes(self.placeholder_images)
+
+        # SSID label centered above the box
+        self.scene.add(TextNode(
+            self.app.font_TINY_24, "Available Wireless Networks:", BLACK,
+            midbottom=(self.ssid_box_rect.centerx, self.ssid_box_rect.top - 10)
+        ))
+        self.ssid_list = VirtualList(self.ssid_box_rect, self.ssid_line_height, self.draw_ssid_row)
+        self.ssid_list_node = self.scene.add(DrawNode(self.ssid_box_rect, self.draw_ssid_list))
+
+        self.rescan_node = self.scene.add(ImageNode(self.rescan_images[0], self.rescan_button_rect.topleft))
+        self.manual_node = self.scene.add(ImageNode(self.manual_images[0], self.manual_button_rect.topleft))
+        self.skip_node = self.scene.add(ImageNode(self.skip_images[0], self.skip_button_rect.topleft))
+
+        self.status_node = self.scene.add(self.make_status_node())
+        self.osk_node = None
+        self.modal_status_node = None
+
+    def make_status_node(self):
+        return TextNode(
+            self.app.font_NES_24, None, BLACK, LAYER_OVERLAY + 1,
+            center=(PHYSICAL_WIDTH//2, self.button_y - 50)
+        )
 
     # -------------------------------------------------------------------------
     # SOUND
     # -------------------------------------------------------------------------
     def load_sounds(self):
-        try:
-            click_path = self.app.get_path("sounds","select.ogg")
-            hover_path = self.app.get_path("sounds","hover.ogg")
-            self.click_sound = pygame.mixer.Sound(click_path)
-            self.click_sound.set_volume(0.5)
-            self.hover_sound = pygame.mixer.Sound(hover_path)
-            self.hover_sound.set_volume(0.1)
-        except Exception as e:
-            log(f"Failed to load WiFi screen sounds: {e}")
-            self.click_sound = None
-            self.hover_sound = None
+        self.click_sound, self.hover_sound = self.load_ui_sounds()
 
     def play_click_sound(self):
         if SOUND_ENABLED and self.click_sound:
@@ -219,14 +229,13 @@ class WiFiScreen(Screen):
                 # Check for SSID click
                 if self.ssid_box_rect.collidepoint(mx,my):
                     # We transform mouse coords to scrolled coords
-                    local_y = (my - self.ssid_box_rect.top) + self.ssid_scroll_offset
-                    idx = local_y // self.ssid_line_height
+                    idx = self.ssid_list.index_at(my, self.ssid_scroll_offset)
                     if 0 <= idx < len(self.networks):
                         self.play_click_sound()
                         self.user_just_clicked = True
                         self.selected_network_index = idx
-                        # Show password OSK
-                        self.ask_for_password(idx)
+                        # Saved profile, or show password OSK
+                        self.connect_to_network(idx)
                         break
 
                 # Check for scrolling: wheel up/down
@@ -290,19 +299,6 @@ class WiFiScreen(Screen):
                     self.app.screen_manager.change_screen("terms")
                     break
 
-            elif e.type == pygame.JOYBUTTONDOWN:
-                if e.button==0:
-                    self.play_click_sound()
-                    self.user_just_clicked=True
-                    self.handle_return_key()
-                    break
-                elif e.button==1:
-                    self.app.screen_manager.change_screen("terms")
-                    break
-
-            elif e.type == pygame.JOYAXISMOTION:
-                print(f"(WIFI) Joy axis {e.axis} => {e.value:.2f}")
-
         # If selection changed => maybe hover sound
         if self.current_selection != old_selection and not self.user_just_clicked:
             now_ms = pygame.time.get_ticks()
@@ -320,8 +316,7 @@ class WiFiScreen(Screen):
                 if self.osk_mode=="custom_ssid":
                     # we do NOT add it to networks yet
                     # we go straight to password
-                    self.osk_mode = None
-                    self.osk = None
+                    self.close_osk()
                     custom_ssid = text.strip()
                     if custom_ssid:
                         # go to ask_for_password for that custom SSID
@@ -333,17 +328,10 @@ class WiFiScreen(Screen):
                 elif self.osk_mode=="password":
                     # We got the password for either an existing or custom SSID
                     pw = text.strip()
-                    if self.temp_ssid_name:
-                        # custom SSID
-                        ssid = self.temp_ssid_name
-                    else:
-                        # existing index
-                        ssid = self.networks[self.selected_network_index]
+                    # The SSID named in the prompt, whatever rescans did to the list since
+                    self.try_connect(self.temp_ssid_name, pw)
 
-                    self.try_connect(ssid, pw)
-
-                self.osk_mode = None
-                self.osk = None
+                self.close_osk()
                 break
 
     # -------------------------------------------------------------------------
@@ -355,30 +343,46 @@ class WiFiScreen(Screen):
         Then go to password OSK if not empty
         """
         self.temp_ssid_name = None
-        self.osk_mode = "custom_ssid"
-        self.osk = OnScreenKeyboard("")
-        self.osk.prompt_label = "Enter your custom SSID name"
-        self.osk.set_font(self.app.font_TINY_24)
-        pygame.event.clear()
+        self.open_osk("custom_ssid", "Enter your custom SSID name")
 
     def ask_for_password(self, index=None, custom_ssid=None):
         """
         Called if user clicks an existing SSID or after finishing custom SSID.
         - If index is not None, we use self.networks[index]
-        - If custom_ssid is given, we store it in self.temp_ssid_name
+        - Otherwise custom_ssid
+        The SSID is stored in self.temp_ssid_name until the password is submitted.
         """
         if index is not None:
             ssid = self.networks[index]
-            self.temp_ssid_name = None
         else:
             ssid = custom_ssid
-            self.temp_ssid_name = ssid
+        self.temp_ssid_name = ssid
+
+        self.open_osk("password", f"Enter password for {ssid}")
 
-        self.osk_mode = "password"
+    def open_osk(self, mode, prompt_label):
+        """
+        Show the OSK in a modal: the screen behind it is frozen into a dimmed
+        snapshot, so only the bottom bar and the status line redraw while typing.
+        """
+        self.osk_mode = mode
         self.osk = OnScreenKeyboard("")
-        self.osk.prompt_label = f"Enter password for {ssid}"
+        self.osk.prompt_label = prompt_label
         self.osk.set_font(self.app.font_TINY_24)
-        pygame.event.clear()
+
+        # The status line moves to the modal; keep it out of the snapshot
+        self.status_node.set_text(None)
+        modal = self.app.screen_manager.open_modal()
+        self.osk_node = modal.scene.add(DrawNode(self.osk_bar_rect(), self.draw_osk_overlay, LAYER_OVERLAY))
+        self.modal_status_node = modal.scene.add(self.make_status_node())
+        self.app.input.flush()
+
+    def close_osk(self):
+        self.osk_mode = None
+        self.osk = None
+        self.osk_node = None
+        self.modal_status_node = None
+        self.app.screen_manager.close_modal()
 
     # -------------------------------------------------------------------------
     # LEFT/RIGHT TABBING
@@ -402,7 +406,7 @@ class WiFiScreen(Screen):
 
     def handle_return_key(self):
         if self.current_selection=='networks' and self.selected_network_index>=0:
-            self.ask_for_password(self.selected_network_index)
+            self.connect_to_network(self.selected_network_index)
         elif self.current_selection=='manual':
             self.ask_for_custom_ssid()
         elif self.current_selection=='rescan':
@@ -435,50 +439,120 @@ class WiFiScreen(Screen):
         else:
             self.app.screen_manager.change_screen("final")
 
+    def connect_to_network(self, index):
+        """Saved profiles are brought up directly; anything else needs a password."""
+        ssid = self.networks[index]
+        if ssid in self.known_ssids:
+            self.try_connect(ssid, None)
+        else:
+            self.ask_for_password(index)
+
     def try_connect(self, ssid, password):
         """
         Attempt to connect. If success => add to list (if not in list),
         and set connected. If fail => show error. do not add to list.
+        With password=None the saved profile is activated instead; if that
+        fails we fall back to asking for the password.
+        Either way the time until the interface has an IP is logged.
         """
         def worker():
-            self.message_queue.put(("info", f"Connecting to {ssid}", BLACK))
-            cmd = ["/usr/bin/nmcli","dev","wifi","connect",ssid,"password",password]
+            self.post_message(("info", f"Connecting to {ssid}", BLACK))
+            backend = self.app.network_backend
+            start = time.monotonic()
             try:
-                res = subprocess.run(cmd, capture_output=True, text=True, timeout=30, check=True)
-                # if we reach here => success
-                if "successfully activated" in res.stdout:
-                    self.message_queue.put(("success", ssid, BLACK))
+                if password is None:
+                    path = "saved profile"
+                    ok, message = backend.activate(ssid)
+                else:
+                    path = "password"
+                    ok, message = backend.connect(ssid, password)
+                if ok:
+                    address = backend.wait_for_ip()
+                    secs = time.monotonic() - start
+                    if address:
+                        log(f"Connected to {ssid} via {path}: time to IP {secs:.2f}s ({address})")
+                    else:
+                        log(f"Connected to {ssid} via {path}, but no IP after {secs:.2f}s")
+                    self.post_message(("success", (ssid, secs if address else None)))
+                elif password is None:
+                    log(f"Saved profile for {ssid} failed ({message}), asking for password")
+                    self.post_message(("need_password", ssid))
                 else:
-                    # Maybe it succeeded but no mention
-                    self.message_queue.put(("error", f"Failed: {res.stdout}", RED))
-            except subprocess.CalledProcessError as cpe:
-                # e.g. exit code 10
-                err_msg = f"nmcli failed (RC={cpe.returncode}): {cpe.stderr or cpe.stdout}"
-                self.message_queue.put(("error", err_msg, RED))
-            except subprocess.TimeoutExpired:
-                self.message_queue.put(("error","Connection timed out.",RED))
+                    self.post_message(("error", message, RED))
             except Exception as ex:
-                self.message_queue.put(("error", str(ex), RED))
+                self.post_message(("error", str(ex), RED))
 
         threading.Thread(target=worker, daemon=True).start()
 
     # -------------------------------------------------------------------------
     # MESSAGES
     # -------------------------------------------------------------------------
-    def update(self):
-        while not self.message_queue.empty():
-            msg_type, content, color = self._parse_msg_tuple(self.message_queue.get())
-            if msg_type=="info":
-                self.set_status_message(content, color, 3)
-            elif msg_type=="success":
-                # connected
-                if content not in self.networks:
-                    self.networks.insert(0, content)
-                self.connected_ssid = content
-                self.set_status_message(f"Connected to {content}!", color, 3)
-                self.scan_wifi()
-            elif msg_type=="error":
-                self.set_status_message(content, color, 4)
+    def post_message(self, message):
+        """Called from worker threads."""
+        event_bus.post(WIFI_EVENT, message)
+
+    def handle_message(self, message):
+        msg_type, content, color = self._parse_msg_tuple(message)
+        if msg_type=="info":
+            self.set_status_message(content, color, 3)
+        elif msg_type=="success":
+            # connected
+            ssid, time_to_ip = content
+            if ssid not in self.networks:
+                self.networks.insert(0, ssid)
+            self.connected_ssid = ssid
+            self.known_ssids.add(ssid)
+            if time_to_ip is not None:
+                self.set_status_message(f"Connected to {ssid}! (IP in {time_to_ip:.1f}s)", color, 3)
+            else:
+                self.set_status_message(f"Connected to {ssid}, waiting for an IP address", color, 3)
+            self.scan_wifi()
+        elif msg_type=="need_password":
+            # Pin the SSID: the selection may have moved while NM was trying
+            self.ask_for_password(None, content)
+        elif msg_type=="error":
+            self.set_status_message(content, color, 4)
+        elif msg_type=="scan_started":
+            self.set_status_message("Scanning networks...", BLACK, 3)
+        elif msg_type=="networks_cached":
+            networks, known, saved_at = content
+            if not self.networks:
+                self.apply_scan(networks, None, known)
+                self.list_stale = True
+                age = format_age(time.time() - saved_at)
+                self.set_status_message(f"Networks from {age} ago, scanning...", BLACK, 3)
+        elif msg_type in ("networks", "scan_done"):
+            self.apply_scan(*content)
+            if msg_type=="scan_done":
+                self.list_stale = False
+                self.set_status_message(f"Found {len(self.networks)} networks.", BLACK, 3)
+        elif msg_type=="scan_failed":
+            self.set_status_message(content, RED, 4)
+
+    def apply_scan(self, networks, connected, known):
+        """
+        Merge a scan into the list on screen. Rows keep their order, so the
+        selection follows its SSID and the scroll position stays put.
+        """
+        selected = None
+        if 0 <= self.selected_network_index < len(self.networks):
+            selected = self.networks[self.selected_network_index]
+
+        self.networks = merge_networks(self.networks, networks, connected, known)
+        self.network_info = {net.ssid: net for net in networks}
+        self.known_ssids = set(known)
+        self.connected_ssid = connected
+
+        if selected in self.network_info:
+            # Keep the selected row where it was on screen
+            new_index = self.networks.index(selected)
+            shift = new_index - self.selected_network_index
+            self.ssid_scroll_offset = max(0, self.ssid_scroll_offset + shift*self.ssid_line_height)
+            self.selected_network_index = new_index
+        elif self.selected_network_index >= len(self.networks):
+            self.selected_network_index = len(self.networks) - 1
+        max_offset = max(0, len(self.networks)*self.ssid_line_height - self.ssid_box_rect.height)
+        self.ssid_scroll_offset = min(self.ssid_scroll_offset, max_offset)
 
     def _parse_msg_tuple(self, msg_tuple):
         if len(msg_tuple)==2:
@@ -494,192 +568,144 @@ class WiFiScreen(Screen):
         self.status_expire_time=time.time()+duration
 
     def scan_wifi(self):
-        def scan_worker():
-            now=time.time()
-            if (now - self.last_scan_time)<self.scan_interval:
-                time.sleep(self.scan_interval - (now - self.last_scan_time))
-
-            self.message_queue.put(("info","Scanning networks...",BLACK))
-            subprocess.run(["/usr/bin/nmcli","device","wifi","rescan"], capture_output=True)
-            time.sleep(2)
-
-            p = subprocess.run(
-                ["/usr/bin/nmcli","-t","-f","SSID,IN-USE","device","wifi","list"],
-                capture_output=True, text=True
-            )
-            lines = p.stdout.strip().split("\n")
-
-            new_networks=[]
-            new_connected=None
-
-            for line in lines:
-                if not line.strip():
-                    continue
-                parts=line.split(":",1)
-                if len(parts)!=2:
-                    continue
-                ssid_val=parts[0].strip()
-                in_use=parts[1].strip()
-                if in_use=="*":
-                    new_connected=ssid_val
-                if ssid_val:
-                    new_networks.append(ssid_val)
+        # Coalesced and rate-limited by the app's scan scheduler; never blocks
+        self.app.scan_scheduler.request(self.post_message)
 
-            self.networks=new_networks
-            self.connected_ssid=new_connected
-            self.last_scan_time=time.time()
-
-            self.message_queue.put(("info",f"Found {len(new_networks)} networks.",BLACK))
+    def on_enter(self):
+        self.subscribe(WIFI_EVENT, self.handle_message)
+        # Also on every return to the screen: leaving cancelled the last scan
+        self.scan_wifi()
 
-        threading.Thread(target=scan_worker, daemon=True).start()
+    def on_leave(self):
+        # A late result (e.g. need_password) must not open the OSK over another screen
+        self.unsubscribe(WIFI_EVENT, self.handle_message)
+        self.app.scan_scheduler.cancel()
 
     # -------------------------------------------------------------------------
     # RENDER
     # -------------------------------------------------------------------------
     def render(self, surf):
-        self.render_background_and_bubble(surf)
-
-        for ph in self.placeholder_images:
-            surf.blit(ph["img"], ph["pos"])
-
-        # Draw the SSID label
-        # We'll remove the old code that put it at left +20
-        # Instead we center it above the box
-        label_font = self.app.font_TINY_24
-        label_txt = label_font.render("Available Wireless Networks:", True, BLACK)
-        label_rect = label_txt.get_rect(midbottom=(
-            self.ssid_box_rect.centerx, 
-            self.ssid_box_rect.top - 10
+        first, last = self.ssid_list.visible_range(len(self.networks), self.ssid_scroll_offset)
+        self.ssid_list_node.set_state((
+            tuple(self.networks[first:last]), self.connected_ssid, frozenset(self.known_ssids),
+            self.list_stale, self.selected_network_index, self.current_selection, self.ssid_scroll_offset
         ))
-        surf.blit(label_txt, label_rect)
 
-        # 1) Draw a thin gray border for the SSID box
-        pygame.draw.rect(surf, GRAY, self.ssid_box_rect, 2)
-
-        # 2) We create a "clipping" region so we can scroll
-        old_clip = surf.get_clip()
-        surf.set_clip(self.ssid_box_rect)
-
-        # Start from top of the box
-        base_y = self.ssid_box_rect.top
-
-        for idx, net in enumerate(self.networks):
-            line_y = base_y + (idx * self.ssid_line_height) - self.ssid_scroll_offset
-            # If it's outside the box, we skip rendering
-            if line_y > self.ssid_box_rect.bottom - self.ssid_line_height:
-                continue
-            if line_y < self.ssid_box_rect.top - self.ssid_line_height:
-                continue
-
-            # Check if hovered
-            is_sel = (idx==self.selected_network_index and self.current_selection=='networks')
-            color = GREEN if is_sel else BLACK
-
-            # We'll also highlight if hovered
-            name_txt = self.app.font_NES_24.render(net, True, color)
-
-            # The "CONNECTED" label if self.connected_ssid == net
-            connected_txt = None
-            if self.connected_ssid == net:
-                connected_txt = self.app.font_NES_24.render("CONNECTED", True, GREEN)
-
-            # Draw a small highlight rect if is_sel
-            name_x = self.ssid_box_rect.left + 20
-            name_y = line_y
-            
-            if is_sel:
-                # Create a highlight rectangle with extra horizontal padding (say 8 pixels on left/right)
-                padding = 8
-                text_width = name_txt.get_width()
-                text_height = self.ssid_line_height
-                highlight_rect = pygame.Rect(name_x - padding, name_y, text_width + 2*padding, text_height)
-                pygame.draw.rect(surf, LIGHT_GRAY, highlight_rect, 2)  # use LIGHT_GRAY for the border
-
-            surf.blit(name_txt, (name_x, name_y))
-            if connected_txt:
-                surf.blit(connected_txt, (name_x + 300, name_y))
-
-        surf.set_clip(old_clip)
-
-        # 3) Draw the 3 image buttons (Rescan, Manual, Skip/Continue)
-        self.draw_img_button(
-            surf, self.rescan_button_rect,
-            self.rescan_images[0], self.rescan_images[1], self.rescan_images[2],
+        # The 3 image buttons (Rescan, Manual, Skip/Continue)
+        self.update_img_button(
+            self.rescan_node, self.rescan_button_rect, self.rescan_images,
             (self.current_selection=='rescan')
         )
-        self.draw_img_button(
-            surf, self.manual_button_rect,
-            self.manual_images[0], self.manual_images[1], self.manual_images[2],
+        self.update_img_button(
+            self.manual_node, self.manual_button_rect, self.manual_images,
             (self.current_selection=='manual')
         )
         if self.connected_ssid:
             # continue
-            self.draw_img_button(
-                surf, self.skip_button_rect,
-                self.continue_images[0], self.continue_images[1], self.continue_images[2],
+            self.update_img_button(
+                self.skip_node, self.skip_button_rect, self.continue_images,
                 (self.current_selection=='continue')
             )
         else:
             # skip
-            self.draw_img_button(
-                surf, self.skip_button_rect,
-                self.skip_images[0], self.skip_images[1], self.skip_images[2],
+            self.update_img_button(
+                self.skip_node, self.skip_button_rect, self.skip_images,
                 (self.current_selection=='skip')
             )
 
         # If OSK is active, draw a bottom white bar + OSK
-        if self.osk_mode:
-            self.draw_osk_overlay(surf)
+        status_node = self.status_node
+        if self.osk_mode and self.osk_node:
+            status_node = self.modal_status_node
+            self.osk_node.set_state((
+                self.osk_mode, self.osk.text, self.osk.selected_row, self.osk.selected_col,
+                self.osk.shift, self.osk.special, pygame.mouse.get_pos()
+            ))
 
         # Status message
-        if self.status_message and time.time()<self.status_expire_time:
-            msg_font = self.app.font_NES_24
-            msg_surf= msg_font.render(self.status_message, True, self.status_color)
-            # place at y= (button_y - 50) => 640 - 50 = 590
-            msg_rect= msg_surf.get_rect(center=(PHYSICAL_WIDTH//2, self.button_y - 50))
-            surf.blit(msg_surf, msg_rect)
-        elif self.status_message and time.time()>=self.status_expire_time:
+        if self.status_message and time.time()>=self.status_expire_time:
             self.status_message=None
+        status_node.set_text(self.status_message, self.status_color)
+
+        return super().render(surf)
 
-    def draw_img_button(self, surf, rect, norm, hov, press, selected):
+    def draw_ssid_list(self, surf):
+        # 1) Draw a thin gray border for the SSID box
+        pygame.draw.rect(surf, GRAY, self.ssid_box_rect, 2)
+
+        # 2) Only the rows in view are drawn, from cached row surfaces
+        self.ssid_list.draw(surf, self.networks, self.ssid_scroll_offset, self.ssid_row_state)
+
+    def ssid_row_state(self, idx, net):
+        is_sel = (idx==self.selected_network_index and self.current_selection=='networks')
+        return (is_sel, self.connected_ssid == net, net in self.known_ssids, self.list_stale)
+
+    def draw_ssid_row(self, row, net, state):
+        is_sel, connected, saved, stale = state
+        # Rows from the cached list are grayed out until the live scan is in
+        color = GREEN if is_sel else (STALE_GRAY if stale else BLACK)
+        name_txt = render_text(self.app.font_NES_24, net, color)
+
+        # Draw a small highlight rect if is_sel
+        name_x = 20
+        if is_sel:
+            # Create a highlight rectangle with extra horizontal padding (say 8 pixels on left/right)
+            padding = 8
+            highlight_rect = pygame.Rect(name_x - padding, 0, name_txt.get_width() + 2*padding, self.ssid_line_height)
+            pygame.draw.rect(row, LIGHT_GRAY, highlight_rect, 2)  # use LIGHT_GRAY for the border
+
+        row.blit(name_txt, (name_x, 0))
+        width = name_x + name_txt.get_width() + 8
+        # The "CONNECTED" label if self.connected_ssid == net
+        # or "SAVED" if NetworkManager already has a profile for it
+        label = None
+        if connected:
+            label = render_text(self.app.font_NES_24, "CONNECTED", GREEN)
+        elif saved:
+            label = render_text(self.app.font_NES_24, "SAVED", STALE_GRAY if stale else BLACK)
+        if label:
+            row.blit(label, (name_x + 300, 0))
+            width = max(width, name_x + 300 + label.get_width())
+        return width
+
+    def update_img_button(self, node, rect, images, selected):
+        norm, hov, press = images
         mx, my = pygame.mouse.get_pos()
         is_hover = rect.collidepoint(mx, my)
         if selected or is_hover:
             if pygame.mouse.get_pressed()[0]:
-                surf.blit(press, rect)
+                node.set_image(press)
             else:
-                surf.blit(hov, rect)
+                node.set_image(hov)
         else:
-            surf.blit(norm, rect)
+            node.set_image(norm)
 
     # -------------------------------------------------------------------------
     # OSK OVERLAY
     # -------------------------------------------------------------------------
+    def osk_bar_rect(self):
+        # white bar ~ 400 px high, from y= (PHYSICAL_HEIGHT - 400) to bottom
+        bar_height = 400
+        return pygame.Rect(0, PHYSICAL_HEIGHT - bar_height, PHYSICAL_WIDTH, bar_height)
+
     def draw_osk_overlay(self, surf):
         """
         We'll do a white bar at the bottom. The OSK will appear above it.
         We'll shift OSK up a bit so it's not flush at bottom.
         We also display self.osk.prompt_label, plus the typed text if desired.
+        The dimmed background comes from the modal snapshot.
         """
-        overlay = pygame.Surface((PHYSICAL_WIDTH, PHYSICAL_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0,0,0,180))
-        surf.blit(overlay,(0,0))
-
-        # We'll define a rect for the "white bar" that might be ~ 400 px high
-        # We'll put it from y= (PHYSICAL_HEIGHT - 400) to bottom
-        bar_height = 400
-        bar_rect = pygame.Rect(0, PHYSICAL_HEIGHT - bar_height, PHYSICAL_WIDTH, bar_height)
+        bar_rect = self.osk_bar_rect()
         pygame.draw.rect(surf, WHITE, bar_rect)
 
         # if the OnScreenKeyboard class supports a prompt_label, we can display it
         if hasattr(self.osk, 'prompt_label'):
-            prompt_font = pygame.font.Font(None, 48)
-            prompt_txt = prompt_font.render(self.osk.prompt_label, True, BLACK)
+            prompt_txt = render_text(self.app.font_PROMPT_48, self.osk.prompt_label, BLACK)
             p_rect = prompt_txt.get_rect(midtop=(PHYSICAL_WIDTH//2, bar_rect.top + 10))
             surf.blit(prompt_txt, p_rect)
 
         # We'll shift the OSK's y up a bit so it sits inside the bar
-        self.osk.draw(surf, self.osk_mode, bottom_bar_rect=bar_rect)
+        self.osk.draw(surf, self.osk_mode, bottom_bar_rect=bar_rect, mouse_pos=self.osk_node.state[-1])
 
     # -------------------------------------------------------------------------
     # END
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+
+from . import glyph_atlas
+from .constants import TEXT_CACHE_ENTRIES
+from .utils import log
+
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text, keyed by
+    (font, text, antialias, color). Screens and widgets draw text through
+    render_text() so labels that don't change are rasterized once instead
+    of every frame. The returned surfaces are shared: blit them, never
+    draw onto them.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, antialias, tuple(color))
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = glyph_atlas.render(font, text, color, antialias)
+        self.entries[key] = surf
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "evictions": self.evictions,
+        }
+
+    def describe(self):
+        return (f"{len(self.entries)} cached, {self.hits} hits / {self.misses} misses, "
+                f"{self.evictions} evicted")
+
+    def log_stats(self):
+        log(f"Text cache: {self.describe()}")
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """Drop-in for font.render(text, antialias, color) backed by the shared cache."""
+    return text_cache.render(font, text, color, antialias)
@@ -13,36 +13,61 @@ def log(message: str):
     except Exception as e:
         print(f"Logging failed: {e}")
 
-def show_message(surface: pygame.Surface, message: str, color=WHITE, timeout=2):
-    font = pygame.font.Font(None, 56)  # We'll just use a default system font here
-    overlay = pygame.Surface((PHYSICAL_WIDTH, PHYSICAL_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    surface.blit(overlay, (0, 0))
+def format_age(seconds):
+    """Rough, short age for status lines: '5 min', '3 h', '2 days'."""
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "less than a minute"
+    if minutes < 60:
+        return f"{minutes} min"
+    hours = minutes // 60
+    if hours < 48:
+        return f"{hours} h"
+    return f"{hours // 24} days"
+
+def show_message(screen_manager, message: str, color=WHITE, timeout=2):
+    """
+    Blocking message box over the current screen, drawn as a modal on top
+    of a frozen, dimmed snapshot. Dismissed with Enter / A or after timeout.
+    """
+    from .screen_manager import TextNode
+    from .event_bus import event_bus
+    from . import input_latency
+
+    font = screen_manager.app.font_MESSAGE_56
+    modal = screen_manager.open_modal()
 
     lines = message.strip().split("\n")
     y = PHYSICAL_HEIGHT // 2 - (len(lines) * 40) // 2
     for line in lines:
-        txt_surf = font.render(line, True, color)
-        txt_rect = txt_surf.get_rect(center=(PHYSICAL_WIDTH // 2, y))
-        surface.blit(txt_surf, txt_rect)
+        modal.scene.add(TextNode(font, line, color, center=(PHYSICAL_WIDTH // 2, y)))
         y += 50
 
-    pygame.display.flip()
+    surface = screen_manager.app.display_surf
+    pygame.display.update(modal.scene.render(surface))
+    # The press that brought the message up shows here, not when we return
+    input_latency.frame_done(screen_manager.active_name, True)
 
     start_time = pygame.time.get_ticks()
     waiting = True
     while waiting:
-        for e in pygame.event.get():
+        raw_events = pygame.event.get()
+        input_latency.events_read()
+        events = screen_manager.app.input.process(event_bus.dispatch(raw_events))
+        input_latency.track(events, screen_manager.active_name)
+        for e in events:
             if e.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_RETURN:
                     waiting = False
-            elif e.type == pygame.JOYBUTTONDOWN:
-                if e.button == 0:
-                    waiting = False
+        if waiting:
+            # Only the dismissing press changes the screen (at the caller's next update)
+            input_latency.frame_done(screen_manager.active_name, False)
 
         elapsed_time = (pygame.time.get_ticks() - start_time) / 1000.0
         if elapsed_time > timeout:
             waiting = False
+
+    screen_manager.close_modal()
@@ -2,6 +2,7 @@ import pygame
 import sys
 
 from ..constants import PHYSICAL_WIDTH, PHYSICAL_HEIGHT, GRAY, LIGHT_GRAY, BLACK, BLUE
+from ..text_cache import render_text
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -13,6 +14,10 @@ RED = (200, 0, 0)
 YELLOW = (255, 255, 0)
 
 class OnScreenKeyboard:
+    KEY_W = 80
+    KEY_H = 50
+    KEY_MARGIN = 5
+
     def __init__(self, initial_text=""):
         self.font = None
         self.keys_normal = [
@@ -34,42 +39,33 @@ class OnScreenKeyboard:
         self.special = False
         self.text = initial_text
         self.key_rects = []
+        self.key_grid = []
+        self.layers = {}
+        self.layout_key = None
         self.selected_row = 0
         self.selected_col = 0
         self.done = False
-        
-        # Joystick axis flags for dead-zone logic
-        self.axis_left_active = False
-        self.axis_right_active = False
-        self.axis_up_active = False
-        self.axis_down_active = False
-        self.joystick_deadzone = 0.5
-
-        self.last_move_time = 0
-        self.move_interval = 150
 
     def set_font(self, font):
         self.font = font
+        self.layout_key = None
 
-    def draw(self, surface: pygame.Surface, mode, bottom_bar_rect=None):
+    def draw(self, surface: pygame.Surface, mode, bottom_bar_rect=None, mouse_pos=None):
         """
         Renders the on-screen keyboard in a bottom white bar, with 80x50 keys.
         Shows a highlight for both joystick selection and mouse hover.
         'Special' key displays "!@#$" if self.special == False, or "ABC123" if True.
         Prompt text in black, typed text in green, with vertical padding.
 
+        The keys themselves come from a pre-rendered layer per (special, shift)
+        state, so a frame is one layer blit plus the highlight and the text.
+
         :param surface: The pygame.Surface to draw onto
         :param mode: e.g. "password", "custom_ssid", etc.
         :param bottom_bar_rect: pygame.Rect defining the bottom bar area (white).
                If None, we default to a 400 px tall bar at the bottom of the screen.
+        :param mouse_pos: pointer position for the hover highlight (polled if None)
         """
-        import pygame
-        from ..constants import PHYSICAL_WIDTH, PHYSICAL_HEIGHT  # or your own
-        WHITE = (255,255,255)
-        BLACK = (0,0,0)
-        GREEN = (0,200,0)
-        LIGHT_GRAY = (220,220,220)
-
         # 1) Define a default bottom bar if none provided
         if bottom_bar_rect is None:
             bar_height = 400
@@ -87,13 +83,11 @@ class OnScreenKeyboard:
             # or fallback to something
             self.font = pygame.font.Font(None, 36)
 
-        # 3) Prompt text at top in black, typed text below in green
-        prompt_height = 60
-        prompt_rect = pygame.Rect(
-            bottom_bar_rect.left, bottom_bar_rect.top,
-            bottom_bar_rect.width, prompt_height
-        )
+        self.layout_keys(bottom_bar_rect)
+        if not self.key_rects:
+            return
 
+        # 3) Prompt text at top in black, typed text below in green
         prompt_text = getattr(self, "prompt_label", "")
         if not prompt_text:
             if mode == "password":
@@ -101,103 +95,137 @@ class OnScreenKeyboard:
             else:
                 prompt_text = "Enter SSID Name:"
 
-        # Prompt in black
-        prompt_surf = self.font.render(prompt_text, True, BLACK)
-        prompt_x = prompt_rect.centerx - (prompt_surf.get_width() // 2)
-        prompt_y = prompt_rect.top + 10
-        surface.blit(prompt_surf, (prompt_x, prompt_y))
+        centerx = bottom_bar_rect.centerx
+        prompt_surf = render_text(self.font, prompt_text, BLACK)
+        surface.blit(prompt_surf, (centerx - prompt_surf.get_width() // 2, self.prompt_y))
+
+        typed_surf = render_text(self.font, self.text, GREEN)
+        surface.blit(typed_surf, (centerx - typed_surf.get_width() // 2, self.typed_y))
+
+        # 4) Keys: the cached layer for this state, then the highlights on top
+        layer = self.get_layer()
+        surface.blit(layer, self.keys_rect.topleft)
+
+        highlighted = [(self.selected_row, self.selected_col)]
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        hovered = self.key_at(mouse_pos)
+        if hovered and hovered[2:] != highlighted[0]:
+            highlighted.append(hovered[2:])
+
+        for row_index, col_index in highlighted:
+            if row_index >= len(self.key_grid) or col_index >= len(self.key_grid[row_index]):
+                continue
+            rect = self.key_grid[row_index][col_index][0]
+            pygame.draw.rect(surface, BLUE, rect.inflate(4,4), 3)
+            # The key is drawn over the inner edge of its highlight
+            surface.blit(layer, rect.topleft, rect.move(-self.keys_rect.left, -self.keys_rect.top))
+
+    def layout_keys(self, bottom_bar_rect):
+        """
+        Key rects for this bar and font, computed once. Both layouts have the
+        same row lengths, so one grid serves every keyboard state.
+        """
+        layout_key = (tuple(bottom_bar_rect), self.font)
+        if self.layout_key == layout_key:
+            return
+        self.layout_key = layout_key
+        self.layers = {}
+        self.key_grid = []
+        self.key_rects = []
 
-        # typed text in green, about 30 px below the prompt
-        typed_surf = self.font.render(self.text, True, GREEN)
-        typed_x = prompt_rect.centerx - (typed_surf.get_width() // 2)
-        typed_y = prompt_y + prompt_surf.get_height() + 10
-        surface.blit(typed_surf, (typed_x, typed_y))
+        # Prompt at top in black, typed text about 10 px below it
+        prompt_height = 60
+        line_height = self.font.get_height()
+        self.prompt_y = bottom_bar_rect.top + 10
+        self.typed_y = self.prompt_y + line_height + 10
 
-        # 4) The keys area is the remainder of the bar
+        # The keys area is the remainder of the bar
         keys_area = pygame.Rect(
             bottom_bar_rect.left,
-            prompt_rect.bottom,
+            bottom_bar_rect.top + prompt_height,
             bottom_bar_rect.width,
             bottom_bar_rect.height - prompt_height
         )
 
-        # We'll keep the old 80x50 approach
-        key_w = 80
-        key_h = 50
-        margin = 5
-        self.key_rects = []
-
-        # Calculate total keyboard height => rows * (key_h+margin) - margin
         num_rows = len(self.keys)
         if num_rows == 0:
+            self.keys_rect = pygame.Rect(0, 0, 0, 0)
             return
+        key_w, key_h, margin = self.KEY_W, self.KEY_H, self.KEY_MARGIN
         total_kb_height = num_rows*(key_h+margin) - margin
 
         # We'll place the top of the keyboard ~10 px below typed text
-        kb_start_y = typed_y + typed_surf.get_height() + 10
+        kb_start_y = self.typed_y + line_height + 10
         if (kb_start_y + total_kb_height) > keys_area.bottom:
             # If there's not enough space, clamp
             kb_start_y = keys_area.bottom - total_kb_height - 10
+        self.kb_start_y = kb_start_y
 
-        # 5) For each row in self.keys, we center them horizontally
+        # For each row, we center the keys horizontally
         for row_index, row in enumerate(self.keys):
-            row_len = len(row)
-            total_row_width = row_len*(key_w+margin) - margin
+            total_row_width = len(row)*(key_w+margin) - margin
             row_start_x = keys_area.centerx - (total_row_width//2)
             row_y = kb_start_y + row_index*(key_h + margin)
-
+            grid_row = []
             for col_index, label in enumerate(row):
                 rect = pygame.Rect(row_start_x + col_index*(key_w+margin), row_y, key_w, key_h)
+                grid_row.append((rect, row_start_x))
+                self.key_rects.append((rect, label, row_index, col_index))
+            self.key_grid.append(grid_row)
+
+        self.keys_rect = self.key_rects[0][0].unionall([r for r, _, _, _ in self.key_rects])
+
+    def get_layer(self):
+        """The keys for the current (special, shift) state, rendered once."""
+        state = (self.special, self.shift)
+        layer = self.layers.get(state)
+        if layer is not None:
+            return layer
+
+        layer = pygame.Surface(self.keys_rect.size).convert()
+        layer.fill(WHITE)
+        ox, oy = self.keys_rect.topleft
+        for row_index, row in enumerate(self.keys):
+            for col_index, label in enumerate(row):
+                rect = self.key_grid[row_index][col_index][0].move(-ox, -oy)
                 # Toggle the "Special" label => "!@#$" or "ABC123"
                 display_label = label
                 if label.lower() == "special":
-                    if self.special:
-                        display_label = "ABC123"
-                    else:
-                        display_label = "!@#$"
-
-                # Check joystick selection or mouse hover
-                is_selected = (
-                    hasattr(self, "selected_row") and
-                    hasattr(self, "selected_col") and
-                    row_index == self.selected_row and
-                    col_index == self.selected_col
-                )
-                mouse_hover = rect.collidepoint(pygame.mouse.get_pos())
-
-                if is_selected or mouse_hover:
-                    highlight_rect = rect.inflate(4,4)
-                    pygame.draw.rect(surface, BLUE, highlight_rect, 3)
-
-                # Key background
-                pygame.draw.rect(surface, WHITE, rect)
-                pygame.draw.rect(surface, BLACK, rect, 2)
-
+                    display_label = "ABC123" if self.special else "!@#$"
                 # SHIFT => uppercase
                 disp = display_label.upper() if self.shift else display_label
-                txt_surf = self.font.render(disp, True, BLACK)
-                txt_rect = txt_surf.get_rect(center=rect.center)
-                surface.blit(txt_surf, txt_rect)
-                self.key_rects.append((rect, label, row_index, col_index))
-
 
+                pygame.draw.rect(layer, WHITE, rect)
+                pygame.draw.rect(layer, BLACK, rect, 2)
+                txt_surf = render_text(self.font, disp, BLACK)
+                layer.blit(txt_surf, txt_surf.get_rect(center=rect.center))
+        self.layers[state] = layer
+        return layer
+
+    def key_at(self, pos):
+        """Grid hit-test: (rect, label, row, col) of the key under pos, or None."""
+        if not self.key_grid:
+            return None
+        x, y = pos
+        pitch_y = self.KEY_H + self.KEY_MARGIN
+        row_index, dy = divmod(y - self.kb_start_y, pitch_y)
+        if row_index < 0 or row_index >= len(self.key_grid) or dy >= self.KEY_H:
+            return None
+        grid_row = self.key_grid[row_index]
+        pitch_x = self.KEY_W + self.KEY_MARGIN
+        col_index, dx = divmod(x - grid_row[0][1], pitch_x)
+        if col_index < 0 or col_index >= len(grid_row) or dx >= self.KEY_W:
+            return None
+        rect = grid_row[col_index][0]
+        return (rect, self.keys[row_index][col_index], row_index, col_index)
 
     def handle_event(self, event):
         """
-        Replaces your existing handle_event. 
-        Adds joystick deadzone logic:
-          - Only move once if axis < -0.5 or > 0.5, 
-          - re-center to allow next move.
+        Keyboard and mouse only: the pad and stick reach us as arrow keys,
+        Enter (A), Escape (B) and Tab (X) from the app's input mapper, which
+        also handles deadzones and auto-repeat.
         """
-        import pygame
-
-        # If you haven't defined these flags, define them in __init__:
-        #   self.axis_left_active = False
-        #   self.axis_right_active = False
-        #   self.axis_up_active = False
-        #   self.axis_down_active = False
-        #   self.joystick_deadzone = 0.5
-
         if event.type == pygame.KEYDOWN:
             # keyboard navigation
             if event.key == pygame.K_LEFT:
@@ -212,66 +240,18 @@ class OnScreenKeyboard:
                 self.process_key("OK")
             elif event.key == pygame.K_BACKSPACE:
                 self.process_key("BS")
-            elif event.key == pygame.K_SPACE:
+            elif event.key in (pygame.K_SPACE, pygame.K_TAB):
                 self.process_key("Space")
             elif event.key == pygame.K_ESCAPE:
                 self.process_key("Back")
 
-        elif event.type == pygame.JOYAXISMOTION:
-            # axis=0 => horizontal, axis=1 => vertical
-            axis = event.axis
-            value = event.value
-
-            if axis == 0:  # horizontal
-                if value < -self.joystick_deadzone:  # left tilt
-                    if not self.axis_left_active:
-                        self.axis_left_active = True
-                        self.axis_right_active = False
-                        self.select_previous_key()
-                elif value > self.joystick_deadzone:  # right tilt
-                    if not self.axis_right_active:
-                        self.axis_right_active = True
-                        self.axis_left_active = False
-                        self.select_next_key()
-                else:
-                    # near zero => re-center
-                    self.axis_left_active = False
-                    self.axis_right_active = False
-
-            elif axis == 1:  # vertical
-                if value < -self.joystick_deadzone:  # up
-                    if not self.axis_up_active:
-                        self.axis_up_active = True
-                        self.axis_down_active = False
-                        self.select_previous_row()
-                elif value > self.joystick_deadzone:  # down
-                    if not self.axis_down_active:
-                        self.axis_down_active = True
-                        self.axis_up_active = False
-                        self.select_next_row()
-                else:
-                    self.axis_up_active = False
-                    self.axis_down_active = False
-
-        elif event.type == pygame.JOYBUTTONDOWN:
-            if event.button == 0:  
-                # "A" on many controllers => OK
-                self.process_key("OK")
-            elif event.button == 1:
-                # "B" => maybe "Back"
-                self.process_key("Back")
-            elif event.button == 2:
-                # Another button if needed
-                self.process_key("Space")
         elif event.type == pygame.MOUSEBUTTONDOWN:
             # if you want mouse clicks on keys
             mx, my = event.pos
             if event.button == 1:
-                for rect,label,r,c in self.key_rects:
-                    if rect.collidepoint(mx,my):
-                        self.process_key(label)
-                        break
-
+                hit = self.key_at((mx, my))
+                if hit:
+                    self.process_key(hit[1])
 
     def select_next_key(self):
         self.selected_col += 1
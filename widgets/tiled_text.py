@@ -0,0 +1,135 @@
+import os
+import json
+
+import pygame
+
+from ..constants import BLACK, TEXT_TILE_HEIGHT
+from ..utils import log
+
+LAYOUT_CACHE_VERSION = 2
+
+
+def wrap_lines(font, lines, max_width):
+    """
+    Word-wrap lines to max_width using glyph metrics only. Each distinct
+    word is measured once with font.size(); a line's width is the running
+    sum of word and space advances, so nothing is rasterized and a paragraph
+    is wrapped in one pass. Blank lines are kept, runs of spaces collapse.
+    """
+    space_w = font.size(" ")[0]
+    widths = {}
+    wrapped = []
+    for line in lines:
+        words = [w for w in line.split(" ") if w]
+        if not words:
+            wrapped.append("")
+            continue
+        current = []
+        current_w = 0
+        for w in words:
+            w_width = widths.get(w)
+            if w_width is None:
+                w_width = widths[w] = font.size(w)[0]
+            test_w = current_w + space_w + w_width if current else w_width
+            if test_w > max_width and current:
+                # A word wider than the box still gets a line of its own
+                wrapped.append(" ".join(current))
+                current = [w]
+                current_w = w_width
+            else:
+                current.append(w)
+                current_w = test_w
+        wrapped.append(" ".join(current))
+    return wrapped
+
+
+def cached_wrap_lines(font, lines, max_width, cache_path, key):
+    """
+    wrap_lines() through an on-disk cache. key describes everything the
+    layout depends on (text hash, font, width); a cache written for any
+    other key is ignored and replaced.
+    """
+    key = dict(key, version=LAYOUT_CACHE_VERSION, max_width=max_width)
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["lines"]
+        log(f"Layout cache {cache_path} is stale, re-wrapping")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log(f"Failed to read layout cache {cache_path}: {e}")
+
+    wrapped = wrap_lines(font, lines, max_width)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"key": key, "lines": wrapped}, f)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        log(f"Failed to write layout cache {cache_path}: {e}")
+    return wrapped
+
+
+class TiledText:
+    """
+    A tall block of pre-wrapped lines drawn through fixed-height tiles.
+    Only tiles that intersect the viewport are rasterized; tiles scrolled
+    out of view are dropped and their surfaces reused for the next ones,
+    so memory stays at a few tiles however long the text is.
+    """
+
+    def __init__(self, font, lines, width, color=BLACK, tile_height=TEXT_TILE_HEIGHT, viewport_height=None):
+        self.font = font
+        self.lines = lines
+        self.width = width
+        self.color = color
+        self.tile_height = tile_height
+        self.line_height = font.get_linesize()
+        self.height = self.line_height * len(lines)
+        self.tiles = {}  # tile index -> Surface
+        self.spare = []
+        self.tiles_rendered = 0
+        if viewport_height:
+            # Enough tiles for any scroll position, allocated up front
+            for _ in range(viewport_height // tile_height + 2):
+                self.spare.append(pygame.Surface((width, tile_height), pygame.SRCALPHA))
+
+    def render_tile(self, index):
+        if self.spare:
+            tile = self.spare.pop()
+        else:
+            tile = pygame.Surface((self.width, self.tile_height), pygame.SRCALPHA)
+        tile.fill((0,0,0,0))
+
+        top = index * self.tile_height
+        first = top // self.line_height
+        last = min(len(self.lines), (top + self.tile_height) // self.line_height + 1)
+        for i in range(first, last):
+            if self.lines[i]:
+                tile.blit(self.font.render(self.lines[i], True, self.color), (0, i * self.line_height - top))
+        self.tiles_rendered += 1
+        return tile
+
+    def draw(self, surf, dest_rect, offset):
+        """Blit the part of the text starting offset px down into dest_rect."""
+        first = max(0, offset) // self.tile_height
+        last = (max(0, offset) + dest_rect.height - 1) // self.tile_height
+
+        # Evict tiles that left the viewport before rendering new ones
+        for index in list(self.tiles):
+            if index < first or index > last:
+                self.spare.append(self.tiles.pop(index))
+
+        old_clip = surf.get_clip()
+        surf.set_clip(dest_rect.clip(old_clip))
+        for index in range(first, last + 1):
+            if index * self.tile_height >= self.height:
+                break
+            tile = self.tiles.get(index)
+            if tile is None:
+                tile = self.tiles[index] = self.render_tile(index)
+            surf.blit(tile, (dest_rect.left, dest_rect.top + index * self.tile_height - offset))
+        surf.set_clip(old_clip)
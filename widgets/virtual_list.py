@@ -0,0 +1,64 @@
+import pygame
+
+
+class VirtualList:
+    """
+    A scrolling list of fixed-height rows. The visible index range comes
+    straight from the scroll offset, so drawing costs the same for 5 items
+    or 500. Each visible row is rendered once per (item, state) into a row
+    surface by render_row(row_surface, item, state), which returns how many
+    pixels wide the drawing is so only that part gets blitted. Rows that
+    scroll out of view hand their surfaces back for the next rows to reuse.
+    """
+
+    def __init__(self, rect, row_height, render_row):
+        self.rect = pygame.Rect(rect)
+        self.row_height = row_height
+        self.render_row = render_row
+        self.rows = {}  # (item, state) -> (row surface, drawn area)
+        self.spare = []
+        self.rows_rendered = 0
+        # Every row that can be on screen at once, allocated up front
+        for _ in range(self.rect.height // row_height + 2):
+            self.spare.append(self.new_row())
+
+    def new_row(self):
+        return pygame.Surface((self.rect.width, self.row_height), pygame.SRCALPHA)
+
+    def visible_range(self, count, offset):
+        """
+        Indices [first, last) with a row on screen: rows may hang off the top
+        edge by up to one row, but must end inside the bottom edge.
+        """
+        first = max(0, -((self.row_height - offset) // self.row_height))
+        last = min(count, (self.rect.height + offset - self.row_height) // self.row_height + 1)
+        return first, max(first, last)
+
+    def index_at(self, y, offset):
+        """Index of the row under screen y (may be out of range)."""
+        return (y - self.rect.top + offset) // self.row_height
+
+    def draw(self, surf, items, offset, row_state):
+        first, last = self.visible_range(len(items), offset)
+        visible = [(i, (items[i], row_state(i, items[i]))) for i in range(first, last)]
+
+        # Recycle rows that scrolled out (or changed state) before rendering new ones
+        keep = {key for _, key in visible}
+        for key in list(self.rows):
+            if key not in keep:
+                self.spare.append(self.rows.pop(key)[0])
+
+        old_clip = surf.get_clip()
+        surf.set_clip(self.rect.clip(old_clip))
+        for i, key in visible:
+            cached = self.rows.get(key)
+            if cached is None:
+                row = self.spare.pop() if self.spare else self.new_row()
+                row.fill((0,0,0,0))
+                width = self.render_row(row, *key)
+                area = pygame.Rect(0, 0, min(width or self.rect.width, self.rect.width), self.row_height)
+                cached = self.rows[key] = (row, area)
+                self.rows_rendered += 1
+            row, area = cached
+            surf.blit(row, (self.rect.left, self.rect.top + i * self.row_height - offset), area)
+        surf.set_clip(old_clip)